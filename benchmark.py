@@ -0,0 +1,214 @@
+from gatorTicketMaster import GatorTicketMaster, COMMANDS, WAITLISTS, run_commands
+from red_black_tree import RedBlackTree
+import argparse
+import io
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+# Relative weight of each command in a generated workload
+DEFAULT_MIX = {
+    "Reserve": 40,
+    "Cancel": 15,
+    "Available": 18,
+    "UpdatePriority": 12,
+    "ExitWaitlist": 8,
+    "AddSeats": 2,
+    "ReleaseSeats": 3,
+    "PrintReservations": 0,   # Full listings dominate everything else at scale, opt in explicitly
+}
+
+def generate_workload(ops, seed=0, seats=None, mix=None):
+    # Build a reproducible list of command lines
+    # A shadow GatorTicketMaster tracks state so that Cancel/ExitWaitlist/UpdatePriority
+    # mostly target users that really hold a seat or sit on the waitlist
+    rng = random.Random(seed)
+    mix = mix or DEFAULT_MIX
+    names = [name for name in mix if mix[name] > 0]
+    weights = [mix[name] for name in names]
+    seats = seats or max(10, ops // 20)
+    shadow = GatorTicketMaster()
+    next_user = 1
+
+    lines = [f"Initialize({seats})"]
+    shadow.initialize(seats)
+    for name in rng.choices(names, weights, k=ops):
+        if name == "Reserve":
+            args = (next_user, rng.randint(1, 5))
+            next_user += 1
+        elif name == "Cancel":
+            seat_id = rng.randint(1, shadow.max_seat_id)
+            holder = shadow.seat_holder(seat_id)
+            args = (seat_id, holder if holder is not None else rng.randint(1, next_user))
+        elif name in ("UpdatePriority", "ExitWaitlist"):
+            if shadow.waitlist.heap and rng.random() < 0.9:
+                user_id = rng.choice(shadow.waitlist.heap)[1]
+            else:
+                user_id = rng.randint(1, next_user)
+            args = (user_id, rng.randint(1, 5)) if name == "UpdatePriority" else (user_id,)
+        elif name == "AddSeats":
+            args = (rng.randint(1, 5),)
+        elif name == "ReleaseSeats":
+            user_id = rng.randint(1, next_user)
+            args = (user_id, user_id + rng.randint(0, 10))
+        else:
+            args = ()
+        lines.append(f"{name}({', '.join(map(str, args))})")
+        method, _ = COMMANDS[name]
+        method(shadow, *args)
+    lines.append("Quit()")
+    return lines
+
+def summarize(samples, label):
+    # Format throughput and p50/p99 latency for a list of nanosecond timings
+    if not samples:
+        return f"{label:<24} {0:>9} ops"
+    samples.sort()
+    total = sum(samples)
+    p50 = samples[len(samples) // 2]
+    p99 = samples[min(len(samples) - 1, len(samples) * 99 // 100)]
+    rate = len(samples) / (total / 1e9) if total else float('inf')
+    return f"{label:<24} {len(samples):>9} ops {rate:>14,.0f} ops/sec   p50 {p50 / 1000:>8.2f} us   p99 {p99 / 1000:>8.2f} us"
+
+def bench_system(lines, waitlist="heap"):
+    # Time each GatorTicketMaster command individually and return (report lines, output text)
+    system = GatorTicketMaster(waitlist)
+    timings = {}
+    output = []
+    clock = time.perf_counter_ns
+    for line in lines:
+        command, _, arguments = line.partition('(')
+        method, arity = COMMANDS[command]
+        params = arguments.partition(')')[0].split(',')
+        args = [int(params[i]) for i in range(arity)]
+        start = clock()
+        result = method(system, *args)
+        timings.setdefault(command, []).append(clock() - start)
+        output.append(result.render())
+    report = [summarize(samples, f"system.{command}") for command, samples in sorted(timings.items())]
+    return report, "\n".join(output) + "\n"
+
+def bench_heap(n, seed=0, waitlist="heap", updates=None):
+    # Time one waitlist engine on its own: inserts, priority updates, removals, pops
+    # updates defaults to n // 4; raise it to model priority-update floods
+    rng = random.Random(seed)
+    heap = WAITLISTS[waitlist]()
+    clock = time.perf_counter_ns
+    timings = {"insert": [], "update_priority": [], "remove": [], "pop": []}
+    for user_id in range(n):
+        item = (rng.randint(1, 5), user_id, user_id)
+        start = clock()
+        heap.insert(item)
+        timings["insert"].append(clock() - start)
+    for _ in range(n // 4 if updates is None else updates):
+        user_id = rng.randrange(n)
+        start = clock()
+        heap.update_priority(user_id, rng.randint(1, 5))
+        timings["update_priority"].append(clock() - start)
+    for user_id in rng.sample(range(n), n // 4):
+        start = clock()
+        heap.remove(user_id)
+        timings["remove"].append(clock() - start)
+    while heap:
+        start = clock()
+        heap.pop()
+        timings["pop"].append(clock() - start)
+    return [summarize(samples, f"{waitlist}.{name}") for name, samples in timings.items()]
+
+def bench_tree(n, seed=0):
+    # Time the reservation tree on its own: inserts, lookups, range scans, deletes
+    rng = random.Random(seed)
+    tree = RedBlackTree()
+    keys = list(range(n))
+    rng.shuffle(keys)
+    clock = time.perf_counter_ns
+    timings = {"insert": [], "find": [], "range_100": [], "delete": []}
+    for user_id in keys:
+        start = clock()
+        tree.insert(user_id, user_id + 1)
+        timings["insert"].append(clock() - start)
+    for user_id in rng.sample(keys, n // 2):
+        start = clock()
+        tree.find(user_id)
+        timings["find"].append(clock() - start)
+    for lo in rng.sample(keys, max(1, n // 100)):
+        start = clock()
+        for _ in tree.in_order_traversal(lo, lo + 99):
+            pass
+        timings["range_100"].append(clock() - start)
+    for user_id in keys:
+        start = clock()
+        tree.delete(user_id)
+        timings["delete"].append(clock() - start)
+    return [summarize(samples, f"tree.{name}") for name, samples in timings.items()]
+
+def reference_output(reference_dir, lines):
+    # Run another checkout's gatorTicketMaster.py over the same workload and return its output
+    with tempfile.TemporaryDirectory() as workdir:
+        input_file = os.path.join(workdir, "workload.txt")
+        with open(input_file, 'w') as file:
+            file.write("\n".join(lines) + "\n")
+        subprocess.run([sys.executable, os.path.join(reference_dir, "gatorTicketMaster.py"), input_file], check=True)
+        with open(input_file.replace('.txt', '_output.txt')) as file:
+            return file.read()
+
+def first_difference(expected, actual):
+    # Return a short description of the first differing output line, or None if identical
+    expected_lines = expected.splitlines()
+    actual_lines = actual.splitlines()
+    for number, (want, got) in enumerate(zip(expected_lines, actual_lines), 1):
+        if want != got:
+            return f"line {number}: reference {want!r}, current {got!r}"
+    if len(expected_lines) != len(actual_lines):
+        return f"reference has {len(expected_lines)} lines, current has {len(actual_lines)}"
+    return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GatorTicketMaster and its data structures")
+    parser.add_argument("--ops", type=int, default=100000, help="commands in the generated workload")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--seats", type=int, help="Initialize() size (default ops/20)")
+    parser.add_argument("--waitlist", choices=sorted(WAITLISTS), default="heap", help="waitlist engine for the system suite")
+    parser.add_argument("--updates", type=int, help="UpdatePriority calls in the heap suite (default ops/4)")
+    parser.add_argument("--suite", default="system,heap,tree", help="comma separated: system, heap, tree")
+    parser.add_argument("--print-reservations", type=int, default=0, help="weight of PrintReservations in the mix")
+    parser.add_argument("--write-workload", help="save the generated command file here")
+    parser.add_argument("--reference", help="directory with a reference gatorTicketMaster.py to diff outputs against")
+    args = parser.parse_args()
+
+    suites = set(args.suite.split(','))
+    mix = dict(DEFAULT_MIX, PrintReservations=args.print_reservations)
+    lines = generate_workload(args.ops, args.seed, args.seats, mix)
+    if args.write_workload:
+        with open(args.write_workload, 'w') as file:
+            file.write("\n".join(lines) + "\n")
+
+    if "system" in suites:
+        report, _ = bench_system(lines, args.waitlist)
+        print("\n".join(report))
+        started = time.perf_counter()
+        out = io.StringIO()
+        run_commands(GatorTicketMaster(args.waitlist), lines, out)
+        elapsed = time.perf_counter() - started
+        print(f"{'end-to-end':<24} {len(lines):>9} lines {len(lines) / elapsed:>12,.0f} lines/sec")
+    if "heap" in suites:
+        # Every waitlist engine on the same operation sequence
+        for waitlist in WAITLISTS:
+            print("\n".join(bench_heap(args.ops, args.seed, waitlist, args.updates)))
+    if "tree" in suites:
+        print("\n".join(bench_tree(args.ops, args.seed)))
+
+    if args.reference:
+        out = io.StringIO()
+        run_commands(GatorTicketMaster(), lines, out)
+        difference = first_difference(reference_output(args.reference, lines), out.getvalue())
+        if difference:
+            print(f"Output differs from reference: {difference}")
+            sys.exit(1)
+        print("Output matches reference")
+
+if __name__ == "__main__":
+    main()
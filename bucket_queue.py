@@ -0,0 +1,174 @@
+import heapq
+
+class BucketQueue:
+    # Waitlist with the same interface and pop order as MaxHeap, built for a
+    # small number of distinct priority levels. Each level has its own min-heap
+    # of (timestamp, user_id), and a heap of levels finds the highest one.
+    # Removals and priority updates only touch the user's entry and leave the
+    # old bucket slot behind as stale. Pops skip stale slots, and everything is
+    # compacted once stale slots outnumber live users.
+
+    def __init__(self):
+        self.entries = {}   # user_id -> (priority, user_id, timestamp) for every queued user
+        self.buckets = {}   # priority -> min-heap of (timestamp, user_id), may hold stale slots
+        self.counts = {}    # priority -> live users in that bucket
+        self.levels = []    # min-heap of -priority, one per bucket in self.buckets
+        self.stale = 0
+
+    def _push(self, key):
+        # Add a slot for key to its priority bucket, creating the bucket if needed
+        priority, user_id, timestamp = key
+        bucket = self.buckets.get(priority)
+        if bucket is None:
+            bucket = self.buckets[priority] = []
+            self.counts[priority] = 0
+            heapq.heappush(self.levels, -priority)
+        heapq.heappush(bucket, (timestamp, user_id))
+        self.counts[priority] += 1
+
+    def _retire(self, priority):
+        # A slot in bucket priority no longer belongs to a live entry
+        self.counts[priority] -= 1
+        self.stale += 1
+        if self.stale > 2 * len(self.entries) + 64:
+            self.rebuild(list(self.entries.values()))
+
+    def insert(self, key):
+        # Queue a priority-user-timestamp tuple; returns False if the user is already queued
+        if key[1] in self.entries:
+            return False
+        self.entries[key[1]] = key
+        self._push(key)
+        return True
+
+    def pop(self):
+        # Remove and return the highest priority, earliest queued tuple
+        if not self.entries:
+            return None
+        levels = self.levels
+        while True:
+            priority = -levels[0]
+            if self.counts[priority]:
+                break
+            # Empty buckets are dropped once they reach the top
+            heapq.heappop(levels)
+            self.stale -= len(self.buckets.pop(priority))
+            del self.counts[priority]
+
+        bucket = self.buckets[priority]
+        entries = self.entries
+        while True:
+            timestamp, user_id = heapq.heappop(bucket)
+            item = entries.get(user_id)
+            if item is not None and item[0] == priority and item[2] == timestamp:
+                break
+            self.stale -= 1
+        del entries[user_id]
+        self.counts[priority] -= 1
+        return item
+
+    def pop_many(self, k):
+        # Remove and return up to k highest priority tuples in pop order
+        popped = []
+        while self.entries and len(popped) < k:
+            popped.append(self.pop())
+        return popped
+
+    def remove(self, user_id):
+        # Remove a specific user; its bucket slot goes stale
+        item = self.entries.pop(user_id, None)
+        if item is None:
+            return False
+        self._retire(item[0])
+        return True
+
+    def update_priority(self, user_id, new_priority):
+        # Move a user to another priority level, keeping its original timestamp
+        item = self.entries.get(user_id)
+        if item is None:
+            return False
+        priority, _, timestamp = item
+        if new_priority != priority:
+            key = (new_priority, user_id, timestamp)
+            self.entries[user_id] = key
+            self._push(key)
+            self._retire(priority)
+        return True
+
+    def contains(self, user_id):
+        return user_id in self.entries
+
+    def clear(self):
+        # Drop every waitlisted user
+        self.entries = {}
+        self.buckets = {}
+        self.counts = {}
+        self.levels = []
+        self.stale = 0
+
+    def insert_many(self, items):
+        # Insert several tuples for users not yet queued
+        for item in items:
+            self.insert(item)
+
+    def remove_range(self, lo, hi):
+        # Remove every user with lo <= user_id <= hi and return how many were removed
+        # Narrow ranges probe the entry map; wide ones filter once and rebuild
+        if hi - lo + 1 <= len(self.entries):
+            removed = 0
+            for user_id in range(lo, hi + 1):
+                if self.remove(user_id):
+                    removed += 1
+            return removed
+        size = len(self.entries)
+        self.rebuild([item for item in self.entries.values() if not (lo <= item[1] <= hi)])
+        return size - len(self.entries)
+
+    def rebuild(self, items):
+        # Replace contents with items, heapifying each bucket once in O(n)
+        self.clear()
+        buckets = self.buckets
+        for item in items:
+            priority, user_id, timestamp = item
+            self.entries[user_id] = item
+            buckets.setdefault(priority, []).append((timestamp, user_id))
+        for priority, bucket in buckets.items():
+            heapq.heapify(bucket)
+            self.counts[priority] = len(bucket)
+        self.levels = [-priority for priority in buckets]
+        heapq.heapify(self.levels)
+
+    def validate(self):
+        # Check buckets, live counts and stale accounting against the entry map
+        # Raises AssertionError on the first violation
+        slots = 0
+        live = dict.fromkeys(self.buckets, 0)
+        for priority, bucket in self.buckets.items():
+            slots += len(bucket)
+            for i in range(1, len(bucket)):
+                if bucket[(i - 1) // 2] > bucket[i]:
+                    raise AssertionError(f"bucket {priority} is not a heap")
+            for timestamp, user_id in set(bucket):
+                item = self.entries.get(user_id)
+                if item is not None and item[0] == priority and item[2] == timestamp:
+                    live[priority] += 1
+        for user_id, (priority, uid, _) in self.entries.items():
+            if uid != user_id or priority not in self.buckets:
+                raise AssertionError(f"entry of user {user_id} has no bucket")
+        if live != self.counts or sum(live.values()) != len(self.entries):
+            raise AssertionError("bucket counts do not match the entries")
+        if slots - len(self.entries) != self.stale:
+            raise AssertionError("stale slot count is wrong")
+        if sorted(-level for level in self.levels) != sorted(self.buckets):
+            raise AssertionError("levels do not match the buckets")
+        return len(self.entries)
+
+    def items(self):
+        # Every queued tuple, in no particular order
+        return list(self.entries.values())
+
+    def get_size(self):
+        return len(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
\ No newline at end of file
@@ -0,0 +1,172 @@
+# Result events returned by GatorTicketMaster commands.
+# Each event keeps only the values describing what happened. Text is built
+# when render() (or str()) is called, so replay and bulk modes that never
+# print anything skip the formatting work entirely.
+
+class Event:
+    __slots__ = ('args',)
+    template = ""
+
+    def __init__(self, *args):
+        self.args = args
+
+    def render(self):
+        # Output text exactly as written to the output file (without trailing newline)
+        return self.template.format(*self.args)
+
+    def __str__(self):
+        return self.render()
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.args == other.args
+
+    def __repr__(self):
+        return f"{type(self).__name__}{self.args!r}"
+
+class SeatsInitialized(Event):
+    __slots__ = ()
+    template = "{0} Seats are made available for reservation"
+
+class InvalidSeatCount(Event):
+    __slots__ = ()
+    template = "Invalid input. Please provide a valid number of seats."
+
+class Availability(Event):
+    __slots__ = ('text',)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.text = None
+
+    def render(self):
+        # Built once; the same event is handed out until the next write
+        if self.text is None:
+            self.text = Event.render(self)
+        return self.text
+    template = "Total Seats Available : {0}, Waitlist : {1}"
+
+class SeatReserved(Event):
+    __slots__ = ()
+    template = "User {0} reserved seat {1}"
+
+class Waitlisted(Event):
+    __slots__ = ()
+    template = "User {0} is added to the waiting list"
+
+class AlreadyWaitlisted(Event):
+    __slots__ = ()
+    template = "User {0} is already in the waiting list"
+
+class CancelRejected(Event):
+    __slots__ = ()
+    template = "User {0} has no reservation for seat {1} to cancel"
+
+class Canceled(Event):
+    # args: user_id, then (next_user_id, seat_id) if the seat went to the waitlist, else None
+    __slots__ = ()
+
+    def render(self):
+        user_id, promotion = self.args
+        text = f"User {user_id} canceled their reservation"
+        if promotion is not None:
+            text += f"\nUser {promotion[0]} reserved seat {promotion[1]}"
+        return text
+
+class LeftWaitlist(Event):
+    __slots__ = ()
+    template = "User {0} is removed from the waiting list"
+
+class NotWaitlisted(Event):
+    __slots__ = ()
+    template = "User {0} is not in waitlist"
+
+class PriorityUpdated(Event):
+    __slots__ = ()
+    template = "User {0} priority has been updated to {1}"
+
+class PriorityNotUpdated(Event):
+    __slots__ = ()
+    template = "User {0} priority is not updated"
+
+class SeatsAdded(Event):
+    # args: count, list of (user_id, seat_id) promoted from the waitlist
+    __slots__ = ()
+
+    def render(self):
+        count, assignments = self.args
+        lines = [f"Additional {count} Seats are made available for reservation"]
+        lines.extend(f"User {user_id} reserved seat {seat_id}" for user_id, seat_id in assignments)
+        return "\n".join(lines)
+
+class InvalidRange(Event):
+    __slots__ = ()
+    template = "Invalid input. Please provide a valid range of users."
+
+class RangeReleased(Event):
+    # args: user_id1, user_id2, list of (user_id, seat_id) promoted into released seats
+    __slots__ = ()
+
+    def render(self):
+        user_id1, user_id2, assignments = self.args
+        lines = [f"Reservations of the Users in the range [{user_id1}, {user_id2}] are released"]
+        lines.extend(f"User {user_id} reserved seat {seat_id}" for user_id, seat_id in assignments)
+        return "\n".join(lines)
+
+class RangeCleared(Event):
+    __slots__ = ()
+    template = "Reservations/waitlist of the users in the range [{0}, {1}] have been released"
+
+class Reservations(Event):
+    # args: pieces of the report, each one or more "Seat s, User u" lines, in seat order
+    # The pieces are the report's cached per-block texts, so holding or writing
+    # them never builds one string the size of the whole report
+    __slots__ = ()
+
+    def render(self):
+        return "\n".join(self.args)
+
+    def chunks(self):
+        # Pieces that, each followed by a newline, make up render() plus its newline
+        return self.args or ("",)
+
+class InvalidSeatRange(Event):
+    __slots__ = ()
+    template = "Invalid input. Please provide a valid range of seats."
+
+class InvalidDuration(Event):
+    __slots__ = ()
+    template = "Invalid input. Please provide a valid duration."
+
+class SeatHeld(Event):
+    __slots__ = ()
+    template = "User {0} holds seat {1} until time {2}"
+
+class HoldUnavailable(Event):
+    __slots__ = ()
+    template = "No seat is available to hold for User {0}"
+
+class HoldConfirmed(Event):
+    __slots__ = ()
+    template = "User {0} confirmed seat {1}"
+
+class ConfirmRejected(Event):
+    __slots__ = ()
+    template = "User {0} has no hold on seat {1} to confirm"
+
+class TimeAdvanced(Event):
+    # args: new time, list of (user_id, seat_id, promotion) for holds that expired,
+    # where promotion is (next_user_id, seat_id) or None as in Canceled
+    __slots__ = ()
+
+    def render(self):
+        now, expired = self.args
+        lines = [f"Time advanced to {now}"]
+        for user_id, seat_id, promotion in expired:
+            lines.append(f"Hold of User {user_id} on seat {seat_id} expired")
+            if promotion is not None:
+                lines.append(f"User {promotion[0]} reserved seat {promotion[1]}")
+        return "\n".join(lines)
+
+class Terminated(Event):
+    __slots__ = ()
+    template = "Program Terminated!!"
@@ -1,217 +1,511 @@
 from red_black_tree import RedBlackTree
 from max_heap import MaxHeap
+from bucket_queue import BucketQueue
+from seat_allocator import SeatAllocator
+from seat_index import SeatIndex
+from timer_wheel import TimerWheel
+from report import ReservationReport
+from events import (
+    SeatsInitialized, InvalidSeatCount, Availability, SeatReserved, Waitlisted,
+    AlreadyWaitlisted, CancelRejected, Canceled, LeftWaitlist, NotWaitlisted,
+    PriorityUpdated, PriorityNotUpdated, SeatsAdded, InvalidRange, RangeReleased,
+    RangeCleared, Reservations, InvalidDuration, SeatHeld, HoldUnavailable,
+    HoldConfirmed, ConfirmRejected, TimeAdvanced, InvalidSeatRange, Terminated,
+)
+import argparse
+import mmap
+import os
 import sys
+import time
+
+# Waitlist engines: both pop by highest priority, then earliest timestamp
+# "buckets" suits floods of UpdatePriority over a few priority levels
+WAITLISTS = {
+    "heap": MaxHeap,
+    "buckets": BucketQueue,
+}
 
 class GatorTicketMaster:
-    def __init__(self):
-        # Initialize ticket system with RB tree for reservations and MaxHeap for waitlist
+    def __init__(self, waitlist="heap"):
+        # Initialize ticket system with RB tree for reservations and a WAITLISTS engine for the waitlist
         self.reserved_seats = RedBlackTree()
-        self.available_seats = []
-        self.waitlist = MaxHeap()
+        self.seat_index = SeatIndex()   # seat_id -> user_id, kept in sync with reserved_seats
+        self.available_seats = SeatAllocator()
+        self.waitlist = WAITLISTS[waitlist]()
         self.timestamp = 0
+        self.max_seat_id = 0   # Highest seat number ever issued (reserved or free)
+        self.clock = 0   # Logical time, moved forward only by advance
+        self.holds = {}   # seat_id -> (user_id, expiry time) for seats held but not confirmed
+        self.expiry = TimerWheel()   # Fires (seat_id, user_id, expiry time) when a hold runs out
+        self.version = 0   # Bumped by every mutating command; read caches are valid for one version
+        self.read_cache = {}   # report name -> (version, event)
+        self.report = ReservationReport(self.seat_index)
 
     def initialize(self, seat_count):
         # Initialize system with given number of seats
+        self.version += 1
         if seat_count <= 0:
-            return "Invalid input. Please provide a valid number of seats."
+            return InvalidSeatCount()
         
-        self.available_seats = list(range(1, seat_count + 1))
-        return f"{seat_count} Seats are made available for reservation"
+        # Seats still held from before a re-initialize keep their holders and numbers
+        if len(self.seat_index):
+            self.available_seats.reset(seat_count, lambda seat_id: self.seat_index.holder(seat_id) is not None)
+        else:
+            self.available_seats.reset(seat_count)
+        self.max_seat_id = max(seat_count, self.seat_index.max_seat())
+        return SeatsInitialized(seat_count)
+
+    def _cached(self, name, build):
+        # Return the event build() made for the current version, building it at most once per version
+        entry = self.read_cache.get(name)
+        if entry is not None and entry[0] == self.version:
+            return entry[1]
+        event = build()
+        self.read_cache[name] = (self.version, event)
+        return event
 
     def available(self):
         # Return current count of available seats and waitlist size
-        return f"Total Seats Available : {len(self.available_seats)}, Waitlist : {len(self.waitlist.heap)}"
+        return self._cached("Available", lambda: Availability(len(self.available_seats), len(self.waitlist)))
 
     def reserve(self, user_id, user_priority):
         # Reserve seat for user or add to waitlist if no seats available
+        self.version += 1
         if self.available_seats:
-            seat_id = min(self.available_seats)
-            self.available_seats.remove(seat_id)
+            seat_id = self.available_seats.allocate()
             self.reserved_seats.insert(user_id, seat_id)
-            return f"User {user_id} reserved seat {seat_id}"
+            self.seat_index.assign(seat_id, user_id)
+            return SeatReserved(user_id, seat_id)
         else:
+            if self.waitlist.contains(user_id):
+                return AlreadyWaitlisted(user_id)
             self.timestamp += 1
             self.waitlist.insert((user_priority, user_id, self.timestamp))
-            return f"User {user_id} is added to the waiting list"
+            return Waitlisted(user_id)
+
+    def reserve_many(self, user_ids, user_priorities):
+        # Reserve for many users at once; same outcome and messages as calling
+        # reserve for each pair in order. Seats are taken in one pass, the new
+        # reservations are bulk-loaded into the tree and overflow is heapified
+        # Raises ValueError if the two lists differ in length
+        user_ids = list(user_ids)
+        user_priorities = list(user_priorities)
+        if len(user_ids) != len(user_priorities):
+            raise ValueError(f"Got {len(user_ids)} users but {len(user_priorities)} priorities")
+        self.version += 1
+        seats = self.available_seats.allocate_many(len(user_ids))
+        seated = len(seats)
+        pairs = list(zip(user_ids[:seated], seats))
+        self.reserved_seats.insert_many(pairs)
+        results = []
+        for user_id, seat_id in pairs:
+            self.seat_index.assign(seat_id, user_id)
+            results.append(SeatReserved(user_id, seat_id))
+
+        queued = []
+        queued_users = set()
+        for user_id, user_priority in zip(user_ids[seated:], user_priorities[seated:]):
+            if user_id in queued_users or self.waitlist.contains(user_id):
+                results.append(AlreadyWaitlisted(user_id))
+                continue
+            self.timestamp += 1
+            queued.append((user_priority, user_id, self.timestamp))
+            queued_users.add(user_id)
+            results.append(Waitlisted(user_id))
+        self.waitlist.insert_many(queued)
+        return results
 
     def cancel(self, seat_id, user_id):
         # Cancel reservation and assign seat to highest priority waitlisted user
-        node = self.reserved_seats.find(user_id)
-        if not node or node.seat_id != seat_id:
-            return f"User {user_id} has no reservation for seat {seat_id} to cancel"
+        self.version += 1
+        if self.seat_index.holder(seat_id) != user_id:
+            return CancelRejected(user_id, seat_id)
+
+        self.holds.pop(seat_id, None)
+        return Canceled(user_id, self._vacate(seat_id, user_id))
 
-        self.reserved_seats.delete(user_id)
+    def _vacate(self, seat_id, user_id):
+        # Take seat_id from user_id and give it to the highest priority waitlisted
+        # user, or return it to the free pool
+        # Returns (next_user_id, seat_id) if someone was promoted, else None
+        self.reserved_seats.delete(user_id, seat_id)
+        self.seat_index.release(seat_id)
         
-        if self.waitlist.heap:    # If waitlist exists, assign seat to highest priority user
+        if self.waitlist:    # If waitlist exists, assign seat to highest priority user
             priority, next_user_id, timestamp = self.waitlist.pop()
             self.reserved_seats.insert(next_user_id, seat_id)
-            return f"User {user_id} canceled their reservation\nUser {next_user_id} reserved seat {seat_id}"
-        else:
-            self.available_seats.append(seat_id)
-            return f"User {user_id} canceled their reservation"
+            self.seat_index.assign(seat_id, next_user_id)
+            return (next_user_id, seat_id)
+        self.available_seats.free(seat_id)
+        return None
+
+    def cancel_many(self, seat_ids, user_ids):
+        # Cancel many reservations at once; same outcome and messages as calling
+        # cancel for each pair in order. Promotions are inserted into the tree in
+        # one batch at the end and freed seats go back to the pool together
+        # Raises ValueError if the two lists differ in length
+        seat_ids = list(seat_ids)
+        user_ids = list(user_ids)
+        if len(seat_ids) != len(user_ids):
+            raise ValueError(f"Got {len(seat_ids)} seats but {len(user_ids)} users")
+        self.version += 1
+        results = []
+        promoted = {}   # user_id -> seat_id not yet written to the tree
+        freed = []
+        for seat_id, user_id in zip(seat_ids, user_ids):
+            if self.seat_index.holder(seat_id) != user_id:
+                results.append(CancelRejected(user_id, seat_id))
+                continue
+            self.holds.pop(seat_id, None)
+
+            if promoted.get(user_id) == seat_id:
+                del promoted[user_id]   # Promoted earlier in this batch, never reached the tree
+            else:
+                self.reserved_seats.delete(user_id, seat_id)
+            self.seat_index.release(seat_id)
+
+            if self.waitlist:
+                priority, next_user_id, timestamp = self.waitlist.pop()
+                promoted[next_user_id] = seat_id
+                self.seat_index.assign(seat_id, next_user_id)
+                results.append(Canceled(user_id, (next_user_id, seat_id)))
+            else:
+                freed.append(seat_id)
+                results.append(Canceled(user_id, None))
+
+        self.reserved_seats.insert_many(promoted.items())
+        self.available_seats.free_many(freed)
+        return results
 
     def exit_waitlist(self, user_id):  # Remove user from waitlist if present
-        if self.waitlist.contains(user_id):
-            self.waitlist.remove(user_id)
-            return f"User {user_id} is removed from the waiting list"
-        return f"User {user_id} is not in waitlist"
+        self.version += 1
+        if self.waitlist.remove(user_id):
+            return LeftWaitlist(user_id)
+        return NotWaitlisted(user_id)
 
     def update_priority(self, user_id, new_priority):
         # Update priority of waitlisted user
+        self.version += 1
         if self.waitlist.update_priority(user_id, new_priority):
-            return f"User {user_id} priority has been updated to {new_priority}"
-        return f"User {user_id} priority is not updated"
+            return PriorityUpdated(user_id, new_priority)
+        return PriorityNotUpdated(user_id)
 
     def add_seats(self, count):
         # Add new seats and assign to waitlisted users based on priority
+        self.version += 1
         if count <= 0:
-            return "Invalid input. Please provide a valid number of seats."
+            return InvalidSeatCount()
 
-        start_seat = max(
-            max((node[0] for node in self.reserved_seats.in_order_traversal()), default=0),
-            max(self.available_seats, default=0)
-        ) + 1
-        
-        new_seats = list(range(start_seat, start_seat + count))
-        result = [f"Additional {count} Seats are made available for reservation"]
-
-        # Sort waitlist by priority and timestamp
-        waitlist_users = sorted(
-            [(p, uid, t) for p, uid, t in self.waitlist.heap],
-            key=lambda x: (-x[0], x[2])  # Sort by priority (desc) and timestamp (asc)
-        )
-        self.waitlist.heap = []
-
-        # Assign seats to waitlist users
-        for priority, user_id, timestamp in waitlist_users:
-            if new_seats:
-                seat_id = min(new_seats)
-                new_seats.remove(seat_id)
-                self.reserved_seats.insert(user_id, seat_id)
-                result.append(f"User {user_id} reserved seat {seat_id}")
-            else:
-                self.waitlist.insert((priority, user_id, timestamp))
+        start_seat = self.max_seat_id + 1
+        self.max_seat_id += count
+
+        # Take only the users that will get a seat, highest priority / earliest first
+        promoted = self.waitlist.pop_many(count)
+        assignments = [(user_id, start_seat + i) for i, (_, user_id, _) in enumerate(promoted)]
+        self.reserved_seats.insert_many(assignments)
+        for user_id, seat_id in assignments:
+            self.seat_index.assign(seat_id, user_id)
 
-        self.available_seats.extend(new_seats)
-        return "\n".join(result)
+        self.available_seats.add_range(start_seat + len(promoted), count - len(promoted))
+        return SeatsAdded(count, assignments)
 
     def release_seats(self, user_id1, user_id2):
         # Release all seats held by users in specified ID range
+        self.version += 1
         if user_id1 > user_id2:
-            return "Invalid input. Please provide a valid range of users."
+            return InvalidRange()
 
-        nodes = self.reserved_seats.in_order_traversal()
-        released_seats = []
-        result = []
-        
-        # Find and release seats in range
-        for seat_id, user_id in nodes:
-            if user_id1 <= user_id <= user_id2:
-                released_seats.append(seat_id)
-                self.reserved_seats.delete(user_id)
-         # Remove users from waitlist in range
-        self.waitlist.heap = [
-            item for item in self.waitlist.heap 
-            if not (user_id1 <= item[1] <= user_id2)
-        ]
-
-        if released_seats:
-            result.append(f"Reservations of the Users in the range [{user_id1}, {user_id2}] are released")
-            # Reassign released seats to waitlist users
-            released_seats.sort()
-            while self.waitlist.heap and released_seats:
-                priority, next_user_id, timestamp = self.waitlist.pop()
-                seat_id = released_seats.pop(0)
-                self.reserved_seats.insert(next_user_id, seat_id)
-                result.append(f"User {next_user_id} reserved seat {seat_id}")
-            
-            self.available_seats.extend(released_seats)
-        else:
-            result.append(f"Reservations/waitlist of the users in the range [{user_id1}, {user_id2}] have been released")
-        
-        return "\n".join(result)
+        # Release seats in range, walking only the matching part of the tree
+        released_seats = [seat_id for seat_id, _ in self.reserved_seats.delete_range(user_id1, user_id2)]
+        for seat_id in released_seats:
+            self.seat_index.release(seat_id)
+            self.holds.pop(seat_id, None)
+        # Remove users from waitlist in range
+        self.waitlist.remove_range(user_id1, user_id2)
+
+        if not released_seats:
+            return RangeCleared(user_id1, user_id2)
+
+        # Reassign released seats to waitlist users
+        released_seats.sort()
+        assignments = []
+        while self.waitlist and len(assignments) < len(released_seats):
+            priority, next_user_id, timestamp = self.waitlist.pop()
+            seat_id = released_seats[len(assignments)]
+            self.reserved_seats.insert(next_user_id, seat_id)
+            self.seat_index.assign(seat_id, next_user_id)
+            assignments.append((next_user_id, seat_id))
+
+        self.available_seats.free_many(released_seats[len(assignments):])
+        return RangeReleased(user_id1, user_id2, assignments)
+
+    def hold(self, user_id, duration):
+        # Reserve the lowest free seat for user_id until clock + duration
+        # The seat counts as reserved until then; unless confirmed it is then
+        # released exactly as if the user had canceled it
+        self.version += 1
+        if duration <= 0:
+            return InvalidDuration()
+        if not self.available_seats:
+            return HoldUnavailable(user_id)
+        seat_id = self.available_seats.allocate()
+        self.reserved_seats.insert(user_id, seat_id)
+        self.seat_index.assign(seat_id, user_id)
+        expires = self.clock + duration
+        self.holds[seat_id] = (user_id, expires)
+        self.expiry.schedule(expires, (seat_id, user_id, expires))
+        return SeatHeld(user_id, seat_id, expires)
+
+    def confirm(self, user_id, seat_id):
+        # Turn a hold into a permanent reservation
+        self.version += 1
+        hold = self.holds.get(seat_id)
+        if hold is None or hold[0] != user_id:
+            return ConfirmRejected(user_id, seat_id)
+        del self.holds[seat_id]
+        return HoldConfirmed(user_id, seat_id)
+
+    def advance(self, ticks):
+        # Move the clock forward and release every hold that ran out, in expiry order
+        # Confirmed or canceled holds still have a timer; it is ignored when it fires
+        self.version += 1
+        if ticks < 0:
+            return InvalidDuration()
+        self.clock += ticks
+        expired = []
+        for seat_id, user_id, expires in self.expiry.advance(self.clock):
+            if self.holds.get(seat_id) != (user_id, expires):
+                continue
+            del self.holds[seat_id]
+            expired.append((user_id, seat_id, self._vacate(seat_id, user_id)))
+        return TimeAdvanced(self.clock, expired)
 
     def print_reservations(self):
-        # Print all current reservations sorted by seat number
-        nodes = self.reserved_seats.in_order_traversal()
-        result = []
-        for seat_id, user_id in sorted(nodes, key=lambda x: x[0]):
-            result.append(f"Seat {seat_id}, User {user_id}")
-        return "\n".join(result)
+        # All current reservations in seat order, unchanged between writes
+        return self._cached("PrintReservations", lambda: Reservations(*self.report.parts()))
+
+    def print_reservations_page(self, first_seat, last_seat):
+        # Reservations for seats first_seat..last_seat only, in seat order
+        if first_seat > last_seat:
+            return InvalidSeatRange()
+        return Reservations(*self.report.parts(first_seat, last_seat))
+
+    def seat_holder(self, seat_id):
+        # Return the user holding seat_id, or None if the seat is free or unknown
+        return self.seat_index.holder(seat_id)
+
+    def validate(self):
+        # Check the tree, the waitlist and that every structure agrees on who holds what
+        # Raises AssertionError on the first violation
+        self.reserved_seats.validate()
+        self.waitlist.validate()
+        held = dict(self.seat_index.items())
+        if len(held) != len(self.seat_index):
+            raise AssertionError("seat index count is wrong")
+        if sorted(self.reserved_seats.in_order_traversal()) != sorted(held.items()):
+            raise AssertionError("reservation tree and seat index disagree")
+        for seat_id in self.available_seats.heap:
+            if seat_id in held:
+                raise AssertionError(f"seat {seat_id} is both free and reserved")
+        for seat_id, (user_id, expires) in self.holds.items():
+            if held.get(seat_id) != user_id or expires <= self.clock:
+                raise AssertionError(f"hold on seat {seat_id} is stale")
 
     def quit(self):
         # Terminate program
-        return "Program Terminated!!"
+        return Terminated()
+
+# Command name -> (method, number of integer arguments); call_command ignores Release
+COMMANDS = {
+    "Initialize": (GatorTicketMaster.initialize, 1),
+    "Available": (GatorTicketMaster.available, 0),
+    "Reserve": (GatorTicketMaster.reserve, 2),
+    "Cancel": (GatorTicketMaster.cancel, 2),
+    "AddSeats": (GatorTicketMaster.add_seats, 1),
+    "ReleaseSeats": (GatorTicketMaster.release_seats, 2),
+    "ExitWaitlist": (GatorTicketMaster.exit_waitlist, 1),
+    "UpdatePriority": (GatorTicketMaster.update_priority, 2),
+    "Hold": (GatorTicketMaster.hold, 2),
+    "Confirm": (GatorTicketMaster.confirm, 2),
+    "Advance": (GatorTicketMaster.advance, 1),
+    "PrintReservations": (GatorTicketMaster.print_reservations, 0),
+    "PrintReservationsPage": (GatorTicketMaster.print_reservations_page, 2),
+    "Quit": (GatorTicketMaster.quit, 0),
+}
+OUTPUT_BATCH = 4096   # Output lines buffered before each write call
+# Command arguments must fit in 64 bits, the width of journal records and snapshots,
+# so a command gives the same output whether or not the run is journaled
+ARGUMENT_MIN = -(1 << 63)
+ARGUMENT_MAX = (1 << 63) - 1
+
+def read_lines(input_file, use_mmap=False):
+    # Yield input lines either through normal buffered reads or a memory map
+    if not use_mmap:
+        with open(input_file, 'r') as file:
+            yield from file
+        return
+    with open(input_file, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for raw in iter(mapped.readline, b''):
+                yield raw.decode()
+
+def command_handlers(system):
+    # Bind the COMMANDS table to one GatorTicketMaster instance
+    # Looked up through getattr so that instrumented or journaled methods are used
+    return {name: (getattr(system, method.__name__), arity) for name, (method, arity) in COMMANDS.items()}
+
+def parse_argument(text):
+    # Parse one integer command argument, rejecting values outside ARGUMENT_MIN..ARGUMENT_MAX
+    value = int(text)
+    if not ARGUMENT_MIN <= value <= ARGUMENT_MAX:
+        raise ValueError(f"Argument {value} is out of range")
+    return value
+
+def call_command(handlers, command, arguments):
+    # Run one parsed command and return its result event (None for ignored commands)
+    entry = handlers.get(command)
+    if entry is None:
+        if command == "Release":
+            return None  # Ignore Release command after Quit
+        raise ValueError(f"Unknown command '{command}'")
+    method, arity = entry
+    if arity == 0:
+        return method()
+    if arity == 1:
+        return method(parse_argument(arguments.partition(')')[0]))
+    params = arguments.partition(')')[0].split(',')
+    return method(parse_argument(params[0]), parse_argument(params[1]))
+
+def execute_line(handlers, line):
+    # Run one stripped command line and return its rendered output text, reporting
+    # failures the same way run_commands does (None for ignored commands)
+    command, _, arguments = line.partition('(')
+    try:
+        result = call_command(handlers, command, arguments)
+        return None if result is None else result.render()
+    except Exception as e:
+        return f"Error processing line: {line}\nError details: {str(e)}"
+
+def run_commands(system, lines, out_file, quiet=False):
+    # Execute commands from an iterable of lines and write results in batches
+    # quiet applies the state changes without rendering any results; only
+    # errors are written. Returns the number of input lines consumed
+    # Reservation reports are written piece by piece from the report's cached
+    # blocks rather than joined into one string
+    handlers = command_handlers(system)
+    buffer = []
+    write = buffer.append
+
+    def flush():
+        buffer.append('')
+        out_file.write('\n'.join(buffer))
+        buffer.clear()
+
+    consumed = 0
+    for line in lines:
+        consumed += 1
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            # Parse and execute commands
+            command, _, arguments = line.partition('(')
+            if quiet:
+                if not command.startswith("PrintReservations"):
+                    call_command(handlers, command, arguments)
+                    if command == "Quit":
+                        break
+            else:
+                result = call_command(handlers, command, arguments)
+                if type(result) is Reservations:
+                    if buffer:
+                        flush()
+                    for chunk in result.chunks():
+                        out_file.write(chunk)
+                        out_file.write('\n')
+                elif result is not None:
+                    write(result.render())
+                if command == "Quit":
+                    break
+        except Exception as e:
+            write(f"Error processing line: {line}\nError details: {str(e)}")
+
+        if len(buffer) >= OUTPUT_BATCH:
+            flush()
+
+    if buffer:
+        flush()
+    return consumed
 
 def main():
     # Main function to process commands from input file and write results to output file
-    if len(sys.argv) != 2:
-        print("Usage: python gatorTicketMaster.py <input_file>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Process a GatorTicketMaster command file")
+    parser.add_argument("input_file")
+    parser.add_argument("--mmap", action="store_true", help="read the input through a memory map")
+    parser.add_argument("--stats", action="store_true", help="report lines/sec on stderr")
+    parser.add_argument("--restore", metavar="SNAPSHOT", help="start from a saved snapshot instead of an empty system")
+    parser.add_argument("--snapshot", metavar="SNAPSHOT", help="save the final state here after processing")
+    parser.add_argument("--journal", metavar="PATH", help="write-ahead log mutating commands here, recovering from it first if it exists")
+    parser.add_argument("--sync-every", type=int, default=64, help="journal records per group commit (fsync)")
+    parser.add_argument("--checkpoint-every", type=int, default=100000, help="journal records between checkpoints (0 disables)")
+    parser.add_argument("--waitlist", choices=sorted(WAITLISTS), default="heap", help="waitlist engine")
+    parser.add_argument("--quiet", action="store_true", help="apply commands without formatting results; only errors are written")
+    parser.add_argument("--profile", metavar="JSON_FILE", help="collect hot-path counters and write them here at Quit")
+    args = parser.parse_args()
+    if args.journal and args.restore:
+        parser.error("--journal recovers its own state and cannot be combined with --restore")
 
-    input_file = sys.argv[1]
+    input_file = args.input_file
     output_file = input_file.replace('.txt', '_output.txt')
-    system = GatorTicketMaster()
+    if args.restore:
+        from snapshot import load_snapshot   # Imported lazily: snapshot imports this module
+        system = load_snapshot(args.restore, args.waitlist)
+    elif args.journal:
+        from journal import Journal, recover   # Imported lazily: journal imports this module
+        system, sequence = recover(args.journal, args.waitlist)
+    else:
+        system = GatorTicketMaster(args.waitlist)
+    journal = None
+    if args.journal:
+        journal = Journal(args.journal, args.sync_every, args.checkpoint_every)
+        journal.attach(system, sequence)
+    profiler = None
+    if args.profile:
+        from profiling import Profiler   # Imported lazily: profiling imports this module
+        profiler = Profiler()
+        profiler.attach(system)
     
     try:
         # Process input file and write results to output file
-        with open(input_file, 'r') as file, open(output_file, 'w') as out_file:
-            for line in file:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                try:
-                    # Parse and execute commands
-                    command = line.split('(')[0]
-                    if command == "Initialize":
-                        count = int(line.split('(')[1].split(')')[0])
-                        result = system.initialize(count)
-                    elif command == "Available":
-                        result = system.available()
-                    elif command == "Reserve":
-                        params = line.split('(')[1].split(')')[0].split(',')
-                        user_id = int(params[0])
-                        priority = int(params[1])
-                        result = system.reserve(user_id, priority)
-                    elif command == "Cancel":
-                        params = line.split('(')[1].split(')')[0].split(',')
-                        seat_id = int(params[0])
-                        user_id = int(params[1])
-                        result = system.cancel(seat_id, user_id)
-                    elif command == "AddSeats":
-                        count = int(line.split('(')[1].split(')')[0])
-                        result = system.add_seats(count)
-                    elif command == "ReleaseSeats":
-                        params = line.split('(')[1].split(')')[0].split(',')
-                        user_id1 = int(params[0])
-                        user_id2 = int(params[1])
-                        result = system.release_seats(user_id1, user_id2)
-                    elif command == "ExitWaitlist":
-                        user_id = int(line.split('(')[1].split(')')[0])
-                        result = system.exit_waitlist(user_id)
-                    elif command == "UpdatePriority":
-                        params = line.split('(')[1].split(')')[0].split(',')
-                        user_id = int(params[0])
-                        new_priority = int(params[1])
-                        result = system.update_priority(user_id, new_priority)
-                    elif command == "PrintReservations":
-                        result = system.print_reservations()
-                    elif command == "Quit":
-                        result = system.quit()
-                        out_file.write(result + '\n')
-                        break
-                    elif command == "Release":
-                        continue  # Ignore Release command after Quit
-                    
-                    out_file.write(result + '\n')
-                except Exception as e:
-                    error_msg = f"Error processing line: {line}\nError details: {str(e)}\n"
-                    out_file.write(error_msg)
-
+        started = time.perf_counter()
+        # read_lines opens the input lazily; check it exists before creating the output file
+        os.stat(input_file)
+        with open(output_file, 'w') as out_file:
+            consumed = run_commands(system, read_lines(input_file, args.mmap), out_file, args.quiet)
+        elapsed = time.perf_counter() - started
     except FileNotFoundError:
         print(f"Error: Input file '{input_file}' not found")
         sys.exit(1)
+    finally:
+        if journal:
+            journal.close()
+
+    if profiler:
+        profiler.export(args.profile)
+    if args.snapshot:
+        from snapshot import save_snapshot
+        try:
+            save_snapshot(system, args.snapshot)
+        except ValueError as e:
+            print(f"Error: Could not save snapshot '{args.snapshot}': {e}")
+            sys.exit(1)
+
+    if args.stats:
+        rate = consumed / elapsed if elapsed > 0 else float('inf')
+        print(f"{consumed} lines in {elapsed:.3f}s ({rate:,.0f} lines/sec)", file=sys.stderr)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
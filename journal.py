@@ -0,0 +1,224 @@
+from gatorTicketMaster import GatorTicketMaster
+from snapshot import write_snapshot, read_snapshot
+import os
+import struct
+
+# Journal file: header (magic, version, sequence number of the record before the
+# first one in this file) followed by fixed-size records of one opcode and two
+# int64 arguments. Checkpoint file: header (magic, last sequence number covered)
+# followed by a snapshot. Recovery loads the checkpoint and replays only the
+# journal records with a higher sequence number.
+JOURNAL_MAGIC = b'GTMJ'
+CHECKPOINT_MAGIC = b'GTMC'
+VERSION = 1
+JOURNAL_HEADER = struct.Struct('<4sHQ')
+CHECKPOINT_HEADER = struct.Struct('<4sQ')
+RECORD = struct.Struct('<Bqq')
+
+# Mutating GatorTicketMaster methods: opcode -> (method name, number of arguments)
+OPERATIONS = {
+    1: ("initialize", 1),
+    2: ("reserve", 2),
+    3: ("cancel", 2),
+    4: ("add_seats", 1),
+    5: ("release_seats", 2),
+    6: ("update_priority", 2),
+    7: ("exit_waitlist", 1),
+    8: ("hold", 2),
+    9: ("confirm", 2),
+    10: ("advance", 1),
+}
+# Bulk GatorTicketMaster methods: method name -> opcode logged for each of its
+# (first, second) pairs; they promise the same outcome as the sequential calls
+BULK_OPERATIONS = {
+    "reserve_many": 2,
+    "cancel_many": 3,
+}
+
+def _fsync_directory(path):
+    # Make a rename durable by syncing the directory entry (not supported everywhere)
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def _replace_durably(path, write):
+    # Write a file through a temporary name, fsync it and atomically rename it into place
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as file:
+        write(file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+    _fsync_directory(path)
+
+def recover(path, waitlist="heap"):
+    # Rebuild state from the checkpoint and journal at path
+    # Returns (system, sequence number of the last applied record)
+    checkpoint_path = path + '.ckpt'
+    covered = 0
+    if os.path.exists(checkpoint_path):
+        with open(checkpoint_path, 'rb') as file:
+            magic, covered = CHECKPOINT_HEADER.unpack(file.read(CHECKPOINT_HEADER.size))
+            if magic != CHECKPOINT_MAGIC:
+                raise ValueError(f"{checkpoint_path} is not a GatorTicketMaster checkpoint")
+            system = read_snapshot(file, checkpoint_path, waitlist)
+    else:
+        system = GatorTicketMaster(waitlist)
+
+    sequence = covered
+    if os.path.exists(path):
+        with open(path, 'rb') as file:
+            data = file.read()
+        base = _check_journal_header(data, path)
+        # A crash can leave a partially written record at the end; it was never acknowledged
+        usable = (len(data) - JOURNAL_HEADER.size) // RECORD.size * RECORD.size
+        sequence = base
+        for opcode, first, second in RECORD.iter_unpack(data[JOURNAL_HEADER.size:JOURNAL_HEADER.size + usable]):
+            sequence += 1
+            if sequence <= covered:
+                continue   # Already part of the checkpoint
+            name, arity = OPERATIONS[opcode]
+            try:
+                getattr(system, name)(*(first, second)[:arity])
+            except Exception:
+                pass   # The original run reported this error and carried on; so does replay
+        sequence = max(sequence, covered)
+    return system, sequence
+
+def _check_journal_header(data, path):
+    # Validate a journal header and return its base sequence number
+    if len(data) < JOURNAL_HEADER.size:
+        raise ValueError(f"{path} is truncated")
+    magic, version, base = JOURNAL_HEADER.unpack_from(data)
+    if magic != JOURNAL_MAGIC:
+        raise ValueError(f"{path} is not a GatorTicketMaster journal")
+    if version != VERSION:
+        raise ValueError(f"Unsupported journal version {version}")
+    return base
+
+class Journal:
+    def __init__(self, path, sync_every=64, checkpoint_every=100000):
+        # Append-only write-ahead log with group commit and periodic checkpoints
+        # sync_every: records buffered per write + fsync
+        # checkpoint_every: records between checkpoints (0 disables them)
+        self.path = path
+        self.checkpoint_path = path + '.ckpt'
+        self.sync_every = sync_every
+        self.checkpoint_every = checkpoint_every
+        self.sequence = 0
+        self.pending = []
+        self.since_checkpoint = 0
+        self.system = None
+        self.file = None
+
+    def attach(self, system, sequence=0):
+        # Log every mutating command of system before it runs
+        # sequence is the last record already reflected in system (from recover)
+        self.system = system
+        self.sequence = sequence
+        self._open()
+        for opcode, (name, arity) in OPERATIONS.items():
+            setattr(system, name, self._logged(opcode, arity, getattr(system, name)))
+        for name, opcode in BULK_OPERATIONS.items():
+            setattr(system, name, self._logged_many(opcode, getattr(system, name)))
+        return system
+
+    def _open(self):
+        # Continue the existing journal, dropping any torn tail, or start a new one
+        if os.path.exists(self.path):
+            with open(self.path, 'rb') as file:
+                data = file.read()
+            _check_journal_header(data, self.path)
+            usable = JOURNAL_HEADER.size + (len(data) - JOURNAL_HEADER.size) // RECORD.size * RECORD.size
+            self.file = open(self.path, 'r+b')
+            self.file.truncate(usable)
+            self.file.seek(usable)
+        else:
+            _replace_durably(self.path, lambda file: file.write(JOURNAL_HEADER.pack(JOURNAL_MAGIC, VERSION, self.sequence)))
+            self.file = open(self.path, 'ab')
+
+    def _logged(self, opcode, arity, method):
+        def logged(*args):
+            self.append(opcode, args)
+            result = method(*args)
+            if self.checkpoint_every and self.since_checkpoint >= self.checkpoint_every:
+                self.checkpoint()
+            return result
+        return logged
+
+    def _logged_many(self, opcode, method):
+        def logged(firsts, seconds):
+            firsts = list(firsts)
+            seconds = list(seconds)
+            if len(firsts) != len(seconds):
+                return method(firsts, seconds)   # Rejected without changing state; nothing to log
+            self.append_many(opcode, zip(firsts, seconds))
+            result = method(firsts, seconds)
+            if self.checkpoint_every and self.since_checkpoint >= self.checkpoint_every:
+                self.checkpoint()
+            return result
+        return logged
+
+    def append(self, opcode, args):
+        # Buffer one record; the batch is written and fsynced every sync_every records
+        self._buffer(self._record(opcode, args))
+
+    def append_many(self, opcode, rows):
+        # Buffer one record per row of arguments
+        # Every row is packed first, so a bad one leaves nothing logged
+        for record in [self._record(opcode, args) for args in rows]:
+            self._buffer(record)
+
+    def _record(self, opcode, args):
+        first = args[0] if len(args) > 0 else 0
+        second = args[1] if len(args) > 1 else 0
+        try:
+            return RECORD.pack(opcode, first, second)
+        except struct.error:
+            raise ValueError(f"Arguments {first}, {second} do not fit in a journal record (64-bit integers only)") from None
+
+    def _buffer(self, record):
+        self.pending.append(record)
+        self.sequence += 1
+        self.since_checkpoint += 1
+        if len(self.pending) >= self.sync_every:
+            self.sync()
+
+    def sync(self):
+        # Group commit: one write and one fsync for every buffered record
+        if self.pending:
+            self.file.write(b''.join(self.pending))
+            self.pending.clear()
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def checkpoint(self):
+        # Snapshot current state, then start an empty journal after it
+        # If we crash between the two renames, recovery skips the records the
+        # checkpoint already covers, so nothing is applied twice
+        self.sync()
+        sequence = self.sequence
+
+        def write_checkpoint(file):
+            file.write(CHECKPOINT_HEADER.pack(CHECKPOINT_MAGIC, sequence))
+            write_snapshot(self.system, file)
+
+        _replace_durably(self.checkpoint_path, write_checkpoint)
+        self.file.close()
+        _replace_durably(self.path, lambda file: file.write(JOURNAL_HEADER.pack(JOURNAL_MAGIC, VERSION, sequence)))
+        self.file = open(self.path, 'ab')
+        self.since_checkpoint = 0
+
+    def close(self):
+        # Flush outstanding records and release the file
+        if self.file:
+            self.sync()
+            self.file.close()
+            self.file = None
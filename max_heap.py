@@ -2,6 +2,7 @@ class MaxHeap:
     def __init__(self):
         # Initialize empty heap for priority-based waitlist
         self.heap = []
+        self.position = {}   # user_id -> index in self.heap, kept in sync on every move
 
     def parent(self, i):
         return (i - 1) // 2
@@ -14,11 +15,18 @@ class MaxHeap:
 
     def swap(self, i, j):
         self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+        self.position[self.heap[i][1]] = i
+        self.position[self.heap[j][1]] = j
 
     def insert(self, key):
         # Insert new priority-user tuple and maintain heap property
+        # Returns False if the user is already queued
+        if key[1] in self.position:
+            return False
         self.heap.append(key)
+        self.position[key[1]] = len(self.heap) - 1
         self._heapify_up(len(self.heap) - 1)
+        return True
 
     def _heapify_up(self, i):
         # Bubble up element to maintain max heap property
@@ -43,55 +51,132 @@ class MaxHeap:
         if not self.heap:
             return None
         if len(self.heap) == 1:
-            return self.heap.pop()
+            max_val = self.heap.pop()
+            del self.position[max_val[1]]
+            return max_val
         
         max_val = self.heap[0]
+        del self.position[max_val[1]]
         self.heap[0] = self.heap.pop()
+        self.position[self.heap[0][1]] = 0
         self._heapify_down(0)
         return max_val
 
+    def pop_many(self, k):
+        # Remove and return up to k highest priority elements in pop order, O(k log n)
+        popped = []
+        while self.heap and len(popped) < k:
+            popped.append(self.pop())
+        return popped
+
     def _heapify_down(self, i):
         # Bubble down element to maintain max heap property
-        largest = i
-        left = self.left_child(i)
-        right = self.right_child(i)
+        heap = self.heap
+        size = len(heap)
+        while True:
+            largest = i
+            left = 2 * i + 1
+            right = left + 1
 
-        if left < len(self.heap) and self._compare(self.heap[left], self.heap[largest]) > 0:
-            largest = left
-        
-        if right < len(self.heap) and self._compare(self.heap[right], self.heap[largest]) > 0:
-            largest = right
+            if left < size and self._compare(heap[left], heap[largest]) > 0:
+                largest = left
+
+            if right < size and self._compare(heap[right], heap[largest]) > 0:
+                largest = right
 
-        if largest != i:
+            if largest == i:
+                return
             self.swap(i, largest)
-            self._heapify_down(largest)
+            i = largest
 
     def remove(self, user_id):
-        # Remove specific user from waitlist
-        for i, (_, uid, _) in enumerate(self.heap):
-            if uid == user_id:
-                self.swap(i, len(self.heap) - 1)
-                self.heap.pop()
-                if i < len(self.heap):
-                    self._heapify_up(i)
-                    self._heapify_down(i)
-                return True
-        return False
+        # Remove specific user from waitlist using the position map
+        i = self.position.get(user_id)
+        if i is None:
+            return False
+        self.swap(i, len(self.heap) - 1)
+        self.heap.pop()
+        del self.position[user_id]
+        if i < len(self.heap):
+            self._heapify_up(i)
+            self._heapify_down(i)
+        return True
 
     def update_priority(self, user_id, new_priority):
         # Update priority of specific user and maintain heap property
-        for i, (_, uid, timestamp) in enumerate(self.heap):
-            if uid == user_id:
-                self.heap[i] = (new_priority, uid, timestamp)
-                self._heapify_up(i)
-                self._heapify_down(i)
-                return True
-        return False
+        i = self.position.get(user_id)
+        if i is None:
+            return False
+        _, uid, timestamp = self.heap[i]
+        self.heap[i] = (new_priority, uid, timestamp)
+        self._heapify_up(i)
+        self._heapify_down(i)
+        return True
 
     def contains(self, user_id):
         # Check if user exists in waitlist
-        return any(uid == user_id for _, uid, _ in self.heap)
+        return user_id in self.position
+
+    def clear(self):
+        # Drop every waitlisted user
+        self.heap = []
+        self.position = {}
+
+    def insert_many(self, items):
+        # Insert several tuples; like insert, users already queued are skipped
+        # (as are repeats within items, where the first one wins)
+        # Large batches are appended and heapified in O(n) instead of sifted one at a time
+        items = list(items)
+        if len(items) <= len(self.heap):
+            for item in items:
+                self.insert(item)
+            return
+        queued = set(self.position)
+        fresh = []
+        for item in items:
+            if item[1] not in queued:
+                queued.add(item[1])
+                fresh.append(item)
+        self.rebuild(self.heap + fresh)
+
+    def remove_range(self, lo, hi):
+        # Remove every user with lo <= user_id <= hi and return how many were removed
+        # Narrow ranges probe the position map; wide ones filter once and heapify in O(n)
+        if hi - lo + 1 <= len(self.heap):
+            removed = 0
+            for user_id in range(lo, hi + 1):
+                if self.remove(user_id):
+                    removed += 1
+            return removed
+        size = len(self.heap)
+        self.rebuild(item for item in self.heap if not (lo <= item[1] <= hi))
+        return size - len(self.heap)
+
+    def rebuild(self, items):
+        # Replace contents with items and restore the heap property bottom-up in O(n)
+        self.heap = list(items)
+        self.position = {item[1]: i for i, item in enumerate(self.heap)}
+        for i in range(len(self.heap) // 2 - 1, -1, -1):
+            self._heapify_down(i)
 
     def get_size(self):
         # Get number of users in waitlist
+        return len(self.heap)
+
+    def validate(self):
+        # Check the heap order and the position map; raises AssertionError on the first violation
+        if len(self.position) != len(self.heap):
+            raise AssertionError("position map and heap have different sizes")
+        for i, item in enumerate(self.heap):
+            if self.position.get(item[1]) != i:
+                raise AssertionError(f"position of user {item[1]} is stale")
+            if i and self._compare(self.heap[self.parent(i)], item) < 0:
+                raise AssertionError(f"user {item[1]} outranks its parent")
+        return len(self.heap)
+
+    def items(self):
+        # Every queued tuple, in heap order
+        return list(self.heap)
+
+    def __len__(self):
         return len(self.heap)
\ No newline at end of file
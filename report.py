@@ -0,0 +1,54 @@
+from seat_index import BLOCK_BITS
+
+class ReservationReport:
+    # Seat-ordered "Seat s, User u" report kept up to date incrementally
+    # The text of each block of seats is cached and only re-rendered after the
+    # SeatIndex reports a change in that block, so a full report after a few
+    # writes only re-renders the touched blocks, and a page of seats a..b
+    # costs O(b - a) plus a lookup per whole block it covers.
+
+    def __init__(self, seat_index):
+        self.seat_index = seat_index
+        self.changed = seat_index.watch()
+        self.blocks = {}   # block number -> rendered text of its held seats ('' if none)
+
+    def _sync(self):
+        # Drop cached blocks whose holders changed since the last render
+        if self.changed:
+            for block in self.changed:
+                self.blocks.pop(block, None)
+            self.changed.clear()
+
+    def _format(self, lo, hi):
+        # Render seats lo..hi straight from the holder array
+        holders = self.seat_index.holders
+        hi = min(hi, len(holders) - 1)
+        return "\n".join(f"Seat {seat_id}, User {holders[seat_id]}"
+                         for seat_id in range(max(lo, 1), hi + 1) if holders[seat_id] is not None)
+
+    def _block(self, block):
+        text = self.blocks.get(block)
+        if text is None:
+            text = self.blocks[block] = self._format(block << BLOCK_BITS, ((block + 1) << BLOCK_BITS) - 1)
+        return text
+
+    def parts(self, lo=1, hi=None):
+        # Report lines for held seats lo..hi (all seats when hi is None) as a tuple of
+        # non-empty block texts in seat order; joined by newlines they form the report
+        self._sync()
+        last_seat = len(self.seat_index.holders) - 1
+        hi = last_seat if hi is None else min(hi, last_seat)
+        lo = max(lo, 1)
+        if lo > hi:
+            return ()
+        # Blocks wholly inside lo..hi come from the cache, partial ones at either end
+        # are rendered directly
+        parts = []
+        for block in range(lo >> BLOCK_BITS, (hi >> BLOCK_BITS) + 1):
+            start = block << BLOCK_BITS
+            end = start + (1 << BLOCK_BITS) - 1
+            if lo <= max(start, 1) and (hi >= end or hi == last_seat):
+                parts.append(self._block(block))
+            else:
+                parts.append(self._format(max(lo, start), min(hi, end)))
+        return tuple(part for part in parts if part)
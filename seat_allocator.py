@@ -0,0 +1,55 @@
+import heapq
+
+class SeatAllocator:
+    def __init__(self):
+        # Min-heap of free seat ids so the lowest free seat is always at index 0
+        self.heap = []
+
+    def reset(self, seat_count, is_held=None):
+        # Make seats 1..seat_count free (an ascending range is already a valid min-heap)
+        # is_held lets the caller skip seats that are still reserved
+        if is_held is None:
+            self.heap = list(range(1, seat_count + 1))
+        else:
+            self.heap = [seat_id for seat_id in range(1, seat_count + 1) if not is_held(seat_id)]
+
+    def allocate(self):
+        # Remove and return the lowest free seat, or None if nothing is free
+        if not self.heap:
+            return None
+        return heapq.heappop(self.heap)
+
+    def allocate_many(self, count):
+        # Remove and return the count lowest free seats in ascending order
+        # Taking most of the pool is cheaper as one sort; the sorted remainder is still a heap
+        count = min(count, len(self.heap))
+        if count * 2 >= len(self.heap):
+            self.heap.sort()
+            taken = self.heap[:count]
+            del self.heap[:count]
+            return taken
+        return [heapq.heappop(self.heap) for _ in range(count)]
+
+    def free(self, seat_id):
+        # Return a single seat to the free pool
+        heapq.heappush(self.heap, seat_id)
+
+    def free_many(self, seat_ids):
+        # Return several seats at once; heapify beats repeated pushes for large batches
+        if len(seat_ids) > len(self.heap):
+            self.heap.extend(seat_ids)
+            heapq.heapify(self.heap)
+        else:
+            for seat_id in seat_ids:
+                heapq.heappush(self.heap, seat_id)
+
+    def add_range(self, start_seat, count):
+        # Append brand new seats above every existing seat id; appending values
+        # larger than everything already in the heap keeps the heap property
+        self.heap.extend(range(start_seat, start_seat + count))
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __bool__(self):
+        return bool(self.heap)
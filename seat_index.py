@@ -0,0 +1,60 @@
+BLOCK_BITS = 8   # Seats are grouped into blocks of 2**BLOCK_BITS for change tracking
+
+class SeatIndex:
+    def __init__(self):
+        # Array indexed by seat_id holding the user_id that reserved it (None when free)
+        # Seats are numbered densely from 1, so a list beats a second tree here
+        self.holders = [None]
+        self.count = 0
+        self.watchers = []   # One set per cache, collecting the blocks whose holders changed
+
+    def assign(self, seat_id, user_id):
+        # Record that user_id now holds seat_id, growing the array if needed
+        if seat_id >= len(self.holders):
+            self.holders.extend([None] * (seat_id + 1 - len(self.holders)))
+        if self.holders[seat_id] is None:
+            self.count += 1
+        self.holders[seat_id] = user_id
+        for changed in self.watchers:
+            changed.add(seat_id >> BLOCK_BITS)
+
+    def release(self, seat_id):
+        # Clear the holder of seat_id and return who held it
+        if seat_id >= len(self.holders):
+            return None
+        user_id = self.holders[seat_id]
+        if user_id is not None:
+            self.holders[seat_id] = None
+            self.count -= 1
+            for changed in self.watchers:
+                changed.add(seat_id >> BLOCK_BITS)
+        return user_id
+
+    def watch(self):
+        # Register a cache and return the set where changed block numbers will
+        # collect; the cache empties it whenever it has caught up
+        changed = set()
+        self.watchers.append(changed)
+        return changed
+
+    def holder(self, seat_id):
+        # O(1) lookup of the user holding seat_id
+        if 0 < seat_id < len(self.holders):
+            return self.holders[seat_id]
+        return None
+
+    def max_seat(self):
+        # Highest held seat id (0 when nothing is held)
+        for seat_id in range(len(self.holders) - 1, 0, -1):
+            if self.holders[seat_id] is not None:
+                return seat_id
+        return 0
+
+    def items(self):
+        # Yield (seat_id, user_id) for every held seat in seat order, no sorting needed
+        for seat_id, user_id in enumerate(self.holders):
+            if user_id is not None:
+                yield (seat_id, user_id)
+
+    def __len__(self):
+        return self.count
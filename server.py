@@ -0,0 +1,178 @@
+from gatorTicketMaster import GatorTicketMaster, command_handlers, execute_line
+import argparse
+import asyncio
+import sys
+import time
+
+# Line protocol server for GatorTicketMaster.
+# Clients send the same command lines as an input file (Reserve(3, 1), ...) and
+# get back exactly the lines that would be written to the output file, in order.
+# Requests can be pipelined. Every connection feeds one shared, bounded queue
+# that a single worker drains, so commands are applied one at a time in arrival
+# order. Waitlist timestamps therefore stay deterministic. Quit answers as usual
+# and then closes that connection. The server keeps running.
+
+class TicketServer:
+    def __init__(self, system=None, queue_size=1024, pipeline_depth=256):
+        # queue_size: commands waiting for the worker across all connections
+        # pipeline_depth: unanswered commands allowed per connection
+        # When either is full the connection stops reading, so TCP pushes back on the client
+        self.system = system or GatorTicketMaster()
+        self.handlers = command_handlers(self.system)
+        self.queue_size = queue_size
+        self.pipeline_depth = pipeline_depth
+        self.queue = None
+        self.worker = None
+        self.commands = 0
+        self.started = None
+        self.server = None
+
+    async def _work(self):
+        # The only task that touches self.system
+        # Everything already queued is applied in one go to avoid a task switch per command
+        queue = self.queue
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            for line, future in batch:
+                result = execute_line(self.handlers, line)
+                if not future.cancelled():
+                    future.set_result(result)
+            self.commands += len(batch)
+
+    async def _handle(self, reader, writer):
+        # Read pipelined lines; a companion task writes the answers back in order
+        replies = asyncio.Queue(self.pipeline_depth)
+        responder = asyncio.create_task(self._respond(replies, writer))
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                line = raw.decode().strip()
+                if not line:
+                    continue
+                future = loop.create_future()
+                await replies.put((line, future))
+                await self.queue.put((line, future))
+                if line.partition('(')[0] == "Quit":
+                    break
+        finally:
+            await replies.put(None)
+            await responder
+        try:
+            # Discard anything pipelined after Quit so closing doesn't reset the
+            # connection before the client has read every reply
+            while await reader.read(65536):
+                pass
+        except ConnectionError:
+            pass
+        writer.close()
+
+    async def _respond(self, replies, writer):
+        try:
+            while True:
+                item = await replies.get()
+                if item is None:
+                    break
+                line, future = item
+                result = await future
+                if result is not None:
+                    writer.write((result + '\n').encode())
+                if replies.empty():
+                    await writer.drain()
+            await writer.drain()
+            if writer.can_write_eof():
+                writer.write_eof()
+        except ConnectionError:
+            pass
+
+    async def start(self, host='127.0.0.1', port=0, unix_path=None):
+        # Start listening and return the bound (host, port), or the socket path
+        self.queue = asyncio.Queue(self.queue_size)
+        self.worker = asyncio.create_task(self._work())
+        self.started = time.perf_counter()
+        if unix_path:
+            self.server = await asyncio.start_unix_server(self._handle, path=unix_path)
+            return unix_path
+        self.server = await asyncio.start_server(self._handle, host, port)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+        self.worker.cancel()
+
+    def throughput(self):
+        # Commands applied so far and the average rate since start
+        elapsed = time.perf_counter() - self.started if self.started else 0
+        return self.commands, (self.commands / elapsed if elapsed > 0 else 0.0)
+
+async def send_commands(lines, host='127.0.0.1', port=None, unix_path=None):
+    # Minimal pipelining client: send every line, then read until the server closes
+    if unix_path:
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+
+    async def send():
+        try:
+            for line in lines:
+                writer.write((line.rstrip('\n') + '\n').encode())
+                await writer.drain()
+            if writer.can_write_eof():
+                writer.write_eof()
+        except ConnectionError:
+            pass   # The server closes the connection after Quit
+
+    sender = asyncio.create_task(send())
+    output = await reader.read()
+    await sender
+    writer.close()
+    return output.decode()
+
+async def report(server, interval):
+    # Print throughput to stderr every interval seconds
+    while True:
+        await asyncio.sleep(interval)
+        commands, rate = server.throughput()
+        print(f"{commands} commands ({rate:,.0f} commands/sec)", file=sys.stderr)
+
+async def serve(args):
+    server = TicketServer(queue_size=args.queue_size, pipeline_depth=args.pipeline_depth)
+    address = await server.start(args.host, args.port, args.unix)
+    print(f"Listening on {address}", file=sys.stderr)
+    reporter = asyncio.create_task(report(server, args.report_every)) if args.report_every else None
+    try:
+        await server.server.serve_forever()
+    finally:
+        if reporter:
+            reporter.cancel()
+        commands, rate = server.throughput()
+        print(f"{commands} commands ({rate:,.0f} commands/sec)", file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the GatorTicketMaster command protocol over TCP or a Unix socket")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--queue-size", type=int, default=1024, help="commands queued for the worker across all connections")
+    parser.add_argument("--pipeline-depth", type=int, default=256, help="unanswered commands allowed per connection")
+    parser.add_argument("--report-every", type=float, default=0, help="seconds between throughput reports (0 disables)")
+    parser.add_argument("--send", metavar="INPUT_FILE", help="act as a client: send this command file and print the replies")
+    args = parser.parse_args()
+
+    if args.send:
+        with open(args.send) as file:
+            lines = [line for line in file if line.strip()]
+        sys.stdout.write(asyncio.run(send_commands(lines, args.host, args.port, args.unix)))
+        return
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
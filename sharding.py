@@ -0,0 +1,132 @@
+from gatorTicketMaster import GatorTicketMaster, command_handlers, execute_line
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+import zlib
+
+# Multi-event engine: each event (venue) is an independent GatorTicketMaster.
+# Events are spread over worker processes by a stable hash of their id. Each
+# worker owns the trees and heaps of its events outright, so nothing is shared.
+# A batch is split per worker, sent to every worker before any reply is
+# awaited, and answered in submission order. Commands for one event always go
+# to the same worker and are applied in the order they were submitted.
+
+def _worker(connection):
+    # Worker process loop: apply batches of (event_id, line) and send back the outputs
+    systems = {}
+    handlers = {}
+    while True:
+        batch = connection.recv()
+        if batch is None:
+            break
+        results = []
+        for event_id, line in batch:
+            if event_id not in systems:
+                systems[event_id] = GatorTicketMaster()
+                handlers[event_id] = command_handlers(systems[event_id])
+            results.append(execute_line(handlers[event_id], line))
+        connection.send(results)
+    connection.close()
+
+class EventManager:
+    def __init__(self, workers=None):
+        # Start one process per worker, each connected by its own pipe
+        self.workers = workers or os.cpu_count() or 1
+        self.connections = []
+        self.processes = []
+        for _ in range(self.workers):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_worker, args=(child,), daemon=True)
+            process.start()
+            child.close()
+            self.connections.append(parent)
+            self.processes.append(process)
+
+    def worker_for(self, event_id):
+        # Stable routing: the same event id maps to the same worker in every run
+        return zlib.crc32(str(event_id).encode()) % self.workers
+
+    def execute_batch(self, commands):
+        # Run a list of (event_id, command line) pairs and return their outputs in the same order
+        per_worker = [[] for _ in range(self.workers)]
+        positions = [[] for _ in range(self.workers)]
+        for position, (event_id, line) in enumerate(commands):
+            worker = self.worker_for(event_id)
+            per_worker[worker].append((event_id, line))
+            positions[worker].append(position)
+
+        # Send everything first so workers run in parallel, then collect
+        for worker, batch in enumerate(per_worker):
+            if batch:
+                self.connections[worker].send(batch)
+        results = [None] * len(commands)
+        for worker, batch in enumerate(per_worker):
+            if batch:
+                for position, result in zip(positions[worker], self.connections[worker].recv()):
+                    results[position] = result
+        return results
+
+    def execute(self, event_id, line):
+        # Convenience wrapper for a single command
+        return self.execute_batch([(event_id, line)])[0]
+
+    def close(self):
+        # Stop every worker process
+        for connection in self.connections:
+            connection.send(None)
+            connection.close()
+        for process in self.processes:
+            process.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def read_commands(input_file):
+    # Parse "<event_id> <command>" lines, skipping blank ones
+    with open(input_file) as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                event_id, _, command = line.partition(' ')
+                yield event_id, command.strip()
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a multi-event command file across worker processes")
+    parser.add_argument("input_file", help='lines of the form "<event_id> <command>", e.g. "17 Reserve(3, 1)"')
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch", type=int, default=10000, help="commands sent per round trip to the workers")
+    args = parser.parse_args()
+
+    output_file = args.input_file.replace('.txt', '_output.txt')
+    started = time.perf_counter()
+    processed = 0
+    with EventManager(args.workers) as manager, open(output_file, 'w') as out_file:
+        batch = []
+        for command in read_commands(args.input_file):
+            batch.append(command)
+            if len(batch) >= args.batch:
+                processed += _write_results(out_file, batch, manager.execute_batch(batch))
+                batch = []
+        if batch:
+            processed += _write_results(out_file, batch, manager.execute_batch(batch))
+    elapsed = time.perf_counter() - started
+    rate = processed / elapsed if elapsed > 0 else float('inf')
+    print(f"{processed} commands on {args.workers} workers in {elapsed:.3f}s ({rate:,.0f} commands/sec)", file=sys.stderr)
+
+def _write_results(out_file, batch, results):
+    # Prefix every output line with its event id so interleaved events stay readable
+    lines = []
+    for (event_id, _), result in zip(batch, results):
+        if result is not None:
+            lines.extend(f"{event_id} {text}" for text in result.split('\n'))
+    if lines:
+        out_file.write('\n'.join(lines) + '\n')
+    return len(batch)
+
+if __name__ == "__main__":
+    main()
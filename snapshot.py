@@ -0,0 +1,140 @@
+from gatorTicketMaster import GatorTicketMaster
+from timer_wheel import TimerWheel
+from array import array
+import os
+import struct
+import sys
+
+# On-disk layout (all integers little-endian):
+#   header  : magic b'GTMS', format version (u16), timestamp, max_seat_id,
+#             reservation count, free seat count, waitlist count, clock,
+#             hold count (all i64)
+#   body    : reservations as (user_id, seat_id) pairs sorted by user_id,
+#             free seat ids, waitlist as (priority, user_id, timestamp) triples,
+#             holds as (seat_id, user_id, expiry time) triples
+# Each body section is a flat int64 array so it can be read with one frombytes call.
+# Version 1 files end after the waitlist and have no clock or holds; they still load.
+MAGIC = b'GTMS'
+VERSION = 2
+HEADER = struct.Struct('<4sH7q')
+V1_HEADER = struct.Struct('<4sH5q')
+
+def _int64_array(rows, describe):
+    # Flatten rows of ints into an int64 array
+    # Raises ValueError naming describe(row) for the first row that does not fit
+    data = array('q')
+    for row in rows:
+        try:
+            data.extend(row)
+        except OverflowError:
+            raise ValueError(f"{describe(row)} does not fit in a snapshot (64-bit integers only)") from None
+    return data
+
+def _write_array(file, data):
+    # Write an int64 array in little-endian order
+    if sys.byteorder == 'big':
+        data = array('q', data)
+        data.byteswap()
+    file.write(data.tobytes())
+
+def _read_array(file, count):
+    # Read count little-endian int64 values
+    data = array('q')
+    data.frombytes(file.read(count * data.itemsize))
+    if len(data) != count:
+        raise ValueError("Snapshot is truncated")
+    if sys.byteorder == 'big':
+        data.byteswap()
+    return data
+
+def save_snapshot(system, path):
+    # Write the full state of a GatorTicketMaster to path
+    # On ValueError the partly written file is removed rather than left unloadable
+    try:
+        with open(path, 'wb') as file:
+            write_snapshot(system, file)
+    except ValueError:
+        os.remove(path)
+        raise
+
+def load_snapshot(path, waitlist="heap"):
+    # Restore a GatorTicketMaster from path
+    with open(path, 'rb') as file:
+        return read_snapshot(file, path, waitlist)
+
+def write_snapshot(system, file):
+    # Write the full state of a GatorTicketMaster to an open binary file
+    # Everything is converted before the first write, so a value that does not
+    # fit raises ValueError without leaving half a snapshot behind
+    reservations = _int64_array(
+        ((user_id, seat_id) for seat_id, user_id in system.reserved_seats.in_order_traversal()),
+        lambda row: f"Reservation of seat {row[1]} by user {row[0]}",
+    )
+    try:
+        free_seats = array('q', system.available_seats.heap)
+    except OverflowError:
+        free_seats = _int64_array(((seat_id,) for seat_id in system.available_seats.heap), lambda row: f"Free seat {row[0]}")
+    waitlist = _int64_array(system.waitlist.items(), lambda row: f"Waitlist entry for user {row[1]} (priority {row[0]})")
+    holds = _int64_array(
+        ((seat_id, user_id, expires) for seat_id, (user_id, expires) in system.holds.items()),
+        lambda row: f"Hold on seat {row[0]} by user {row[1]}",
+    )
+    try:
+        header = HEADER.pack(
+            MAGIC, VERSION, system.timestamp, system.max_seat_id,
+            len(reservations) // 2, len(free_seats), len(waitlist) // 3,
+            system.clock, len(holds) // 3,
+        )
+    except struct.error:
+        raise ValueError(
+            f"Timestamp {system.timestamp}, highest seat {system.max_seat_id} or clock {system.clock} "
+            "does not fit in a snapshot (64-bit integers only)"
+        ) from None
+
+    file.write(header)
+    _write_array(file, reservations)
+    _write_array(file, free_seats)
+    _write_array(file, waitlist)
+    _write_array(file, holds)
+
+def read_snapshot(file, name="snapshot", waitlist="heap"):
+    # Restore a GatorTicketMaster from an open binary file
+    # waitlist picks the engine the restored system uses (see WAITLISTS)
+    # The tree is built bottom-up from the sorted pairs and the waitlist is heapified,
+    # so loading is O(n) rather than n individual inserts
+    system = GatorTicketMaster(waitlist)
+    header = file.read(V1_HEADER.size)
+    if len(header) != V1_HEADER.size:
+        raise ValueError("Snapshot is truncated")
+    magic, version, timestamp, max_seat_id, reserved, free, waiting = V1_HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"{name} is not a GatorTicketMaster snapshot")
+    if version == VERSION:
+        extra = file.read(HEADER.size - V1_HEADER.size)
+        if len(extra) != HEADER.size - V1_HEADER.size:
+            raise ValueError("Snapshot is truncated")
+        clock, held = HEADER.unpack(header + extra)[7:]
+    elif version == 1:
+        clock, held = 0, 0
+    else:
+        raise ValueError(f"Unsupported snapshot version {version}")
+    reservations = _read_array(file, reserved * 2)
+    free_seats = _read_array(file, free)
+    waitlist = _read_array(file, waiting * 3)
+    holds = _read_array(file, held * 3)
+
+    pairs = list(zip(reservations[0::2], reservations[1::2]))
+    system.reserved_seats.build_from_sorted(pairs)
+    for user_id, seat_id in pairs:
+        system.seat_index.assign(seat_id, user_id)
+    # The saved free seats were a valid heap when written
+    system.available_seats.heap = free_seats.tolist()
+    system.waitlist.rebuild(zip(waitlist[0::3], waitlist[1::3], waitlist[2::3]))
+    system.timestamp = timestamp
+    system.max_seat_id = max_seat_id
+    system.clock = clock
+    system.expiry = TimerWheel(clock)
+    for seat_id, user_id, expires in zip(holds[0::3], holds[1::3], holds[2::3]):
+        system.holds[seat_id] = (user_id, expires)
+        system.expiry.schedule(expires, (seat_id, user_id, expires))
+    return system
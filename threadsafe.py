@@ -0,0 +1,251 @@
+from gatorTicketMaster import GatorTicketMaster, command_handlers, execute_line
+from events import Availability, Reservations, InvalidSeatRange
+from seat_index import BLOCK_BITS
+import argparse
+import random
+import sys
+import threading
+import time
+
+# Thread-safe front end for one GatorTicketMaster.
+# Every command runs under a single write lock, so the tree, heap and seat
+# structures only ever have one writer. After each write the writer publishes
+# an immutable ReadView by rebinding one attribute, which is atomic. Readers
+# just take the current view: they never wait for the writer, never hold it
+# up, and never see a half-applied command. Views share the holder blocks of
+# seats that did not change (copy-on-write), so a write copies only the
+# blocks it touched plus one small tuple of block references.
+BLOCK_SIZE = 1 << BLOCK_BITS
+
+class ReadView:
+    # Consistent, read-only state of the system as of one version
+    __slots__ = ('version', 'available_count', 'waitlist_size', 'reserved_count', 'seat_count', 'blocks', 'text')
+
+    def __init__(self, version, available_count, waitlist_size, reserved_count, seat_count, blocks):
+        self.version = version
+        self.available_count = available_count
+        self.waitlist_size = waitlist_size
+        self.reserved_count = reserved_count
+        self.seat_count = seat_count   # Highest seat number issued so far
+        self.blocks = blocks   # Tuple of tuples: blocks[b][i] holds seat b * BLOCK_SIZE + i
+        self.text = None
+
+    def holder(self, seat_id):
+        # User holding seat_id in this view, or None
+        block = seat_id >> BLOCK_BITS
+        if seat_id <= 0 or block >= len(self.blocks):
+            return None
+        holders = self.blocks[block]
+        offset = seat_id & (BLOCK_SIZE - 1)
+        return holders[offset] if offset < len(holders) else None
+
+    def items(self, lo=1, hi=None):
+        # Yield (seat_id, user_id) for held seats lo..hi in seat order
+        lo = max(lo, 1)
+        last_block = len(self.blocks) - 1 if hi is None else min(hi >> BLOCK_BITS, len(self.blocks) - 1)
+        for block in range(lo >> BLOCK_BITS, last_block + 1):
+            start = block << BLOCK_BITS
+            for offset, user_id in enumerate(self.blocks[block]):
+                seat_id = start + offset
+                if user_id is not None and seat_id >= lo and (hi is None or seat_id <= hi):
+                    yield (seat_id, user_id)
+
+    def available(self):
+        return Availability(self.available_count, self.waitlist_size)
+
+    def print_reservations(self):
+        # Rendered once per view; concurrent readers may race to build it, which is harmless
+        if self.text is None:
+            self.text = "\n".join(f"Seat {seat_id}, User {user_id}" for seat_id, user_id in self.items())
+        return Reservations(self.text)
+
+    def print_reservations_page(self, first_seat, last_seat):
+        # Same answer as GatorTicketMaster.print_reservations_page, including the range check
+        if first_seat > last_seat:
+            return InvalidSeatRange()
+        return Reservations("\n".join(f"Seat {seat_id}, User {user_id}"
+                                      for seat_id, user_id in self.items(first_seat, last_seat)))
+
+class ThreadSafeTicketMaster:
+    def __init__(self, system=None):
+        self.system = system or GatorTicketMaster()
+        self.handlers = command_handlers(self.system)
+        self.write_lock = threading.Lock()
+        self.blocks = []   # Writer-side block list; published views get a tuple of it
+        self.changed = self.system.seat_index.watch()
+        self.view = None
+        with self.write_lock:
+            self._publish(everything=True)
+
+    def _publish(self, everything=False):
+        # Copy the blocks the last writes touched and publish a new view (write lock held)
+        system = self.system
+        holders = system.seat_index.holders
+        blocks = self.blocks
+        grown = len(blocks)
+        needed = (len(holders) + BLOCK_SIZE - 1) >> BLOCK_BITS
+        blocks.extend([None] * (needed - grown))
+        changed = range(needed) if everything else [*self.changed, *range(grown, needed)]
+        for block in changed:
+            blocks[block] = tuple(holders[block << BLOCK_BITS:(block + 1) << BLOCK_BITS])
+        self.changed.clear()
+        self.view = ReadView(system.version, len(system.available_seats), len(system.waitlist),
+                             len(system.seat_index), system.max_seat_id, tuple(blocks))
+
+    # Writers
+
+    def execute(self, line):
+        # Run one command line as the single writer and return its output text
+        with self.write_lock:
+            result = execute_line(self.handlers, line)
+            self._publish()
+        return result
+
+    def execute_batch(self, lines):
+        # Run several command lines under one lock acquisition and publish once
+        with self.write_lock:
+            results = [execute_line(self.handlers, line) for line in lines]
+            self._publish()
+        return results
+
+    def call(self, command, *args):
+        # Run one command by name, e.g. call("Reserve", 7, 2), and return its event
+        with self.write_lock:
+            method, _ = self.handlers[command]
+            result = method(*args)
+            self._publish()
+        return result
+
+    def validate(self):
+        # Check every invariant of the live structures (waits for the writer)
+        with self.write_lock:
+            self.system.validate()
+
+    # Readers: never take the lock
+
+    def snapshot(self):
+        return self.view
+
+    def available(self):
+        return self.view.available()
+
+    def print_reservations(self):
+        return self.view.print_reservations()
+
+    def print_reservations_page(self, first_seat, last_seat):
+        return self.view.print_reservations_page(first_seat, last_seat)
+
+    def seat_holder(self, seat_id):
+        return self.view.holder(seat_id)
+
+def check_view(view):
+    # Invariants that hold for every consistent view of a system initialized once
+    reserved = sum(1 for _ in view.items())
+    if reserved != view.reserved_count:
+        raise AssertionError(f"view {view.version}: {reserved} held seats listed, {view.reserved_count} counted")
+    if view.available_count + view.reserved_count != view.seat_count:
+        raise AssertionError(f"view {view.version}: free and held seats do not add up to {view.seat_count}")
+
+def stress(writers=4, readers=4, ops=20000, seats=500, seed=0, validate_every=500):
+    # Hammer one ThreadSafeTicketMaster from writer and reader threads at once
+    # Writers apply random commands and validate the tree and heap periodically;
+    # readers check every view they take. Returns (writes, reads, validations, errors)
+    shared = ThreadSafeTicketMaster()
+    shared.execute(f"Initialize({seats})")
+    done = threading.Event()
+    errors = []
+    counts = {"writes": 0, "reads": 0, "validations": 0}
+    counts_lock = threading.Lock()
+
+    def writer(number):
+        rng = random.Random(seed * 1000 + number)
+        try:
+            for i in range(1, ops // writers + 1):
+                roll = rng.random()
+                user_id = rng.randint(1, seats * 2)
+                if roll < 0.35:
+                    line = f"Reserve({user_id}, {rng.randint(1, 5)})"
+                elif roll < 0.6:
+                    view = shared.snapshot()
+                    seat_id = rng.randint(1, max(view.seat_count, 1))
+                    line = f"Cancel({seat_id}, {view.holder(seat_id) or user_id})"
+                elif roll < 0.7:
+                    line = f"UpdatePriority({user_id}, {rng.randint(1, 5)})"
+                elif roll < 0.75:
+                    line = f"ExitWaitlist({user_id})"
+                elif roll < 0.85:
+                    line = f"Hold({user_id}, {rng.randint(1, 50)})"
+                elif roll < 0.9:
+                    line = f"Advance({rng.randint(0, 10)})"
+                elif roll < 0.95:
+                    line = f"ReleaseSeats({user_id}, {user_id + rng.randint(0, 10)})"
+                else:
+                    line = f"AddSeats({rng.randint(1, 3)})"
+                shared.execute(line)
+                if i % validate_every == 0:
+                    shared.validate()
+                    with counts_lock:
+                        counts["validations"] += 1
+            with counts_lock:
+                counts["writes"] += ops // writers
+        except Exception as e:
+            errors.append(f"writer {number}: {e!r}")
+
+    def reader(number):
+        last_version = -1
+        reads = 0
+        try:
+            while not done.is_set():
+                view = shared.snapshot()
+                if view.version < last_version:
+                    raise AssertionError(f"version went back from {last_version} to {view.version}")
+                last_version = view.version
+                check_view(view)
+                text = view.print_reservations().render()
+                if (text.count("\n") + 1 if text else 0) != view.reserved_count:
+                    raise AssertionError(f"view {view.version}: listing does not match the count")
+                reads += 1
+        except Exception as e:
+            errors.append(f"reader {number}: {e!r}")
+        with counts_lock:
+            counts["reads"] += reads
+
+    reader_threads = [threading.Thread(target=reader, args=(n,)) for n in range(readers)]
+    writer_threads = [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+    for thread in reader_threads + writer_threads:
+        thread.start()
+    for thread in writer_threads:
+        thread.join()
+    done.set()
+    for thread in reader_threads:
+        thread.join()
+    try:
+        shared.validate()
+        check_view(shared.snapshot())
+        counts["validations"] += 1
+    except AssertionError as e:
+        errors.append(f"final: {e}")
+    return counts["writes"], counts["reads"], counts["validations"], errors
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress ThreadSafeTicketMaster with concurrent writers and readers")
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--ops", type=int, default=20000, help="commands across all writers")
+    parser.add_argument("--seats", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--validate-every", type=int, default=500, help="commands per writer between full invariant checks")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    writes, reads, validations, errors = stress(args.writers, args.readers, args.ops, args.seats, args.seed, args.validate_every)
+    elapsed = time.perf_counter() - started
+    print(f"{writes} writes, {reads} consistent reads, {validations} invariant checks in {elapsed:.3f}s")
+    for error in errors:
+        print(error, file=sys.stderr)
+    if errors:
+        sys.exit(1)
+    print("All invariants held")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
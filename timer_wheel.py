@@ -0,0 +1,89 @@
+class TimerWheel:
+    # Hierarchical timing wheel over integer ticks
+    # Level l has SLOTS slots, each covering SLOTS**l ticks. A timer is filed
+    # at the lowest level whose current rotation contains its deadline and
+    # moves down one level whenever the wheel below wraps around to its slot.
+    # It is therefore touched at most LEVELS times before it fires, so
+    # scheduling and expiring are amortized O(1) per timer. Deadlines beyond
+    # the top level wait in an overflow list that is re-filed once per top
+    # level rotation. Cancellation is up to the caller: expired items that no
+    # longer apply are simply ignored.
+    SLOT_BITS = 6
+    SLOTS = 1 << SLOT_BITS
+    LEVELS = 4
+
+    def __init__(self, now=0):
+        self.now = now
+        self.wheels = [[[] for _ in range(self.SLOTS)] for _ in range(self.LEVELS)]
+        self.overflow = []
+        self.count = 0      # Timers filed anywhere in the wheel
+        self.filed = [0] * self.LEVELS   # Timers filed at each level
+        self.sequence = 0   # Keeps timers that fire on the same tick in scheduling order
+
+    def schedule(self, deadline, item):
+        # File item to fire at tick deadline (deadlines already passed fire on the next tick)
+        self.sequence += 1
+        self.count += 1
+        self._file((max(deadline, self.now + 1), self.sequence, item))
+
+    def _file(self, timer):
+        deadline = timer[0]
+        now = self.now
+        for level in range(self.LEVELS):
+            shift = self.SLOT_BITS * level
+            if deadline >> (shift + self.SLOT_BITS) == now >> (shift + self.SLOT_BITS):
+                self.wheels[level][(deadline >> shift) & (self.SLOTS - 1)].append(timer)
+                self.filed[level] += 1
+                return
+        self.overflow.append(timer)
+
+    def advance(self, target):
+        # Move the clock to tick target and return the items that fired, in
+        # deadline order and then scheduling order
+        # Stretches where the lower levels are empty are skipped up to the next
+        # boundary of the lowest occupied level, so idle time costs O(LEVELS)
+        fired = []
+        mask = self.SLOTS - 1
+        while self.now < target:
+            lowest = 0
+            while lowest < self.LEVELS and not self.filed[lowest]:
+                lowest += 1
+            if lowest:
+                # Nothing can fire before the next boundary of level lowest
+                last_quiet_tick = self.now | ((1 << (self.SLOT_BITS * lowest)) - 1)
+                if not self.count or last_quiet_tick >= target:
+                    self.now = target
+                    break
+                self.now = last_quiet_tick
+            self.now = now = self.now + 1
+            # Crossing a boundary of level l pulls that level's current slot down a
+            # level; the highest level goes first so its timers can cascade all the way
+            if not now & mask:
+                level = 1
+                while level < self.LEVELS and not (now >> (self.SLOT_BITS * level)) & mask:
+                    level += 1
+                if level == self.LEVELS:
+                    overflow, self.overflow = self.overflow, []
+                    self._refile(overflow)
+                for level in range(min(level, self.LEVELS - 1), 0, -1):
+                    wheel = self.wheels[level]
+                    slot = (now >> (self.SLOT_BITS * level)) & mask
+                    timers, wheel[slot] = wheel[slot], []
+                    self.filed[level] -= len(timers)
+                    self._refile(timers)
+            wheel = self.wheels[0]
+            timers = wheel[now & mask]
+            if timers:
+                wheel[now & mask] = []
+                timers.sort()
+                self.count -= len(timers)
+                self.filed[0] -= len(timers)
+                fired.extend(item for _, _, item in timers)
+        return fired
+
+    def _refile(self, timers):
+        for timer in timers:
+            self._file(timer)
+
+    def __len__(self):
+        return self.count
\ No newline at end of file